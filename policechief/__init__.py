@@ -5,6 +5,8 @@ Author: BrandjuhNL
 
 from .policechief import PoliceChief
 
+__all__ = ["PoliceChief", "setup"]
+
 __red_end_user_data_statement__ = "This cog stores user game profiles and progress data."
 
 
@@ -7,13 +7,15 @@ import aiosqlite
 import logging
 from pathlib import Path
 
+from .repository import CONNECTION_PRAGMAS
+
 log = logging.getLogger("red.policechief.migrations")
 
 
 class MigrationManager:
     """Manages database schema migrations."""
     
-    CURRENT_VERSION = 3
+    CURRENT_VERSION = 4
     
     def __init__(self, db_path: Path):
         self.db_path = db_path
@@ -21,19 +23,17 @@ class MigrationManager:
     async def initialize(self):
         """Initialize database and run migrations if needed."""
         async with aiosqlite.connect(self.db_path) as db:
-            # Create version table if it doesn't exist
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS schema_version (
-                    version INTEGER PRIMARY KEY,
-                    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            await db.commit()
+            # journal_mode=WAL is stored in the database file, so every later
+            # connection inherits it
+            for pragma in CONNECTION_PRAGMAS:
+                await db.execute(pragma)
             
-            # Get current version
-            async with db.execute("SELECT MAX(version) FROM schema_version") as cursor:
+            # Schema version lives in the database header
+            async with db.execute("PRAGMA user_version") as cursor:
                 row = await cursor.fetchone()
-                current_version = row[0] if row[0] is not None else 0
+                current_version = row[0]
+            if current_version == 0:
+                current_version = await self._adopt_legacy_version(db)
             
             # Run migrations
             if current_version < self.CURRENT_VERSION:
@@ -42,22 +42,48 @@ class MigrationManager:
             else:
                 log.info(f"Database schema is up to date (version {current_version})")
     
+    async def _adopt_legacy_version(self, db: aiosqlite.Connection) -> int:
+        """Move the version from the old schema_version table into user_version."""
+        async with db.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'schema_version'"
+        ) as cursor:
+            if await cursor.fetchone() is None:
+                return 0
+        async with db.execute("SELECT MAX(version) FROM schema_version") as cursor:
+            row = await cursor.fetchone()
+            version = row[0] if row[0] is not None else 0
+        await db.executescript(
+            "BEGIN;\n"
+            f"PRAGMA user_version = {int(version)};\n"
+            "DROP TABLE schema_version;\n"
+            "COMMIT;"
+        )
+        log.info(f"Moved schema version {version} from schema_version table to user_version")
+        return version
+    
     async def _run_migrations(self, db: aiosqlite.Connection, from_version: int):
-        """Run all migrations from from_version to CURRENT_VERSION."""
+        """Run all migrations from from_version to CURRENT_VERSION.
+
+        Each migration returns its DDL as one script, which runs together with
+        the user_version bump in a single transaction and executescript call.
+        """
         for version in range(from_version + 1, self.CURRENT_VERSION + 1):
             log.info(f"Applying migration to version {version}")
             migration_method = getattr(self, f"_migrate_to_v{version}", None)
             if migration_method:
-                await migration_method(db)
-                await db.execute("INSERT INTO schema_version (version) VALUES (?)", (version,))
-                await db.commit()
+                await db.executescript(
+                    "BEGIN;\n"
+                    f"{migration_method()}\n"
+                    f"PRAGMA user_version = {int(version)};\n"
+                    "COMMIT;"
+                )
+                log.info(f"Applied migration to version {version}")
             else:
                 log.warning(f"No migration method found for version {version}")
     
-    async def _migrate_to_v1(self, db: aiosqlite.Connection):
+    def _migrate_to_v1(self) -> str:
         """Initial schema creation."""
-        # Player profiles table
-        await db.execute("""
+        return """
             CREATE TABLE IF NOT EXISTS player_profiles (
                 user_id INTEGER PRIMARY KEY,
                 station_level INTEGER DEFAULT 1,
@@ -82,39 +108,27 @@ class MigrationManager:
                 total_expenses_paid INTEGER DEFAULT 0,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Create index for faster lookups
-        await db.execute("""
-            CREATE INDEX IF NOT EXISTS idx_profiles_user_id 
-            ON player_profiles(user_id)
-        """)
-        
-        log.info("Created initial database schema (v1)")
+            );
+        """
 
-    async def _migrate_to_v2(self, db: aiosqlite.Connection):
+    def _migrate_to_v2(self) -> str:
         """Add active missions tracking to player profiles."""
-        await db.execute(
-            "ALTER TABLE player_profiles ADD COLUMN active_missions TEXT"
-        )
-        await db.execute(
-            "UPDATE player_profiles SET active_missions = '[]' WHERE active_missions IS NULL"
-        )
-        log.info("Added active_missions column to player_profiles (v2)")
+        return """
+            ALTER TABLE player_profiles ADD COLUMN active_missions TEXT;
+            UPDATE player_profiles SET active_missions = '[]' WHERE active_missions IS NULL;
+        """
 
-    async def _migrate_to_v3(self, db: aiosqlite.Connection):
+    def _migrate_to_v3(self) -> str:
         """Add equipment storage and assignments to player profiles."""
-        await db.execute(
-            "ALTER TABLE player_profiles ADD COLUMN equipment_inventory TEXT"
-        )
-        await db.execute(
-            "ALTER TABLE player_profiles ADD COLUMN equipment_assignments TEXT"
-        )
-        await db.execute(
-            "UPDATE player_profiles SET equipment_inventory = '{}' WHERE equipment_inventory IS NULL"
-        )
-        await db.execute(
-            "UPDATE player_profiles SET equipment_assignments = '{}' WHERE equipment_assignments IS NULL"
-        )
-        log.info("Added equipment columns to player_profiles (v3)")
+        return """
+            ALTER TABLE player_profiles ADD COLUMN equipment_inventory TEXT;
+            ALTER TABLE player_profiles ADD COLUMN equipment_assignments TEXT;
+            UPDATE player_profiles SET equipment_inventory = '{}' WHERE equipment_inventory IS NULL;
+            UPDATE player_profiles SET equipment_assignments = '{}' WHERE equipment_assignments IS NULL;
+        """
+
+    def _migrate_to_v4(self) -> str:
+        """Drop the redundant user_id index; the primary key already covers it."""
+        return """
+            DROP INDEX IF EXISTS idx_profiles_user_id;
+        """
@@ -7,258 +7,493 @@ import aiosqlite
 import asyncio
 import json
 import logging
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict
-from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Dict, Optional, List, Tuple
+from datetime import datetime, timedelta
 
-from ..models import PlayerProfile, ActiveMission
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+from ..models import PlayerProfile, ActiveMission, intern_id
 
 log = logging.getLogger("red.policechief.repository")
 
 
+def _json_default(value: Any) -> Any:
+    """Serialize values the stdlib encoder does not understand."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    def _dumps(value: Any) -> str:
+        """Serialize a value for a TEXT column (datetimes become ISO strings)."""
+        return orjson.dumps(value).decode()
+
+    _loads = orjson.loads
+else:  # pragma: no cover - exercised only without orjson installed
+    def _dumps(value: Any) -> str:
+        """Serialize a value for a TEXT column (datetimes become ISO strings)."""
+        return json.dumps(value, default=_json_default)
+
+    _loads = json.loads
+
+
+# Serialized empty containers; these are common and need no parsing
+_EMPTY_JSON_VALUES = frozenset(("{}", "[]"))
+
+
+def _dumps_sorted(values) -> str:
+    """Serialize a set of IDs as a sorted JSON array for stable output."""
+    return _dumps(sorted(values))
+
+
+def _load_json_column(value: Optional[str], default_factory):
+    """Parse a JSON column, skipping the decode for NULL and empty containers."""
+    if not value or value in _EMPTY_JSON_VALUES:
+        return default_factory()
+    return _loads(value)
+
+
+# Cooldowns are stored as seconds since this naive UTC epoch
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _encode_cooldowns(cooldowns: Dict[str, List[Tuple[datetime, int]]]) -> str:
+    """Serialize cooldowns as ``{key: [[epoch_seconds, count], ...]}``."""
+    return _dumps(
+        {
+            key: [[(ready_at - _EPOCH).total_seconds(), count] for ready_at, count in runs]
+            for key, runs in cooldowns.items()
+        }
+    )
+
+
+def _decode_timestamp(value) -> datetime:
+    """Decode an epoch timestamp, accepting legacy ISO-8601 strings."""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return _EPOCH + timedelta(seconds=value)
+
+
+def _decode_cooldowns(value: Optional[str]) -> Dict[str, List[Tuple[datetime, int]]]:
+    """Parse a cooldown column written by any version of the cog."""
+    cooldowns = {}
+    for key, entries in _load_json_column(value, dict).items():
+        if not isinstance(entries, list):
+            # Oldest format stored a single ready time per key
+            if not entries:
+                continue
+            entries = [entries]
+        runs = []
+        for entry in entries:
+            if isinstance(entry, list):
+                runs.append((_decode_timestamp(entry[0]), int(entry[1])))
+            elif entry:
+                # Older formats stored one ready time per busy unit
+                runs.append((_decode_timestamp(entry), 1))
+        cooldowns[key] = runs
+    return cooldowns
+
+
+def _intern_keys(mapping: Dict[str, Any]) -> Dict[str, Any]:
+    """Rebuild a decoded mapping with interned content-ID keys."""
+    return {intern_id(key): value for key, value in mapping.items()}
+
+
+def _encode_missions(missions: List[ActiveMission]) -> str:
+    """Serialize active missions."""
+    return _dumps(
+        [
+            {
+                "mission_id": mission.mission_id,
+                "name": mission.name,
+                "ends_at": mission.ends_at,
+                "dispatched_at": mission.dispatched_at,
+                "operating_cost": mission.operating_cost,
+                "potential_reward": mission.potential_reward,
+                "success_chance": mission.success_chance,
+                "heat_change": mission.heat_change,
+                "reputation_success": mission.reputation_success,
+                "reputation_failure": mission.reputation_failure,
+            }
+            for mission in missions
+        ]
+    )
+
+
+# Column encoders; columns not listed are bound as-is
+_COLUMN_ENCODERS: Dict[str, Callable[[Any], Any]] = {
+    "unlocked_districts": _dumps_sorted,
+    "owned_vehicles": _dumps,
+    "staff_roster": _dumps,
+    "owned_upgrades": _dumps_sorted,
+    "active_policies": _dumps_sorted,
+    "active_missions": _encode_missions,
+    "equipment_inventory": _dumps,
+    "equipment_assignments": _dumps,
+    "last_tick_ts": lambda value: value.isoformat() if value else None,
+    "automation_enabled": lambda value: 1 if value else 0,
+    "vehicle_cooldowns": _encode_cooldowns,
+    "staff_cooldowns": _encode_cooldowns,
+}
+
+
+# Applied once per connection when the repository connects
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA mmap_size=268435456",
+)
+
+# Number of read-only connections; WAL lets these run alongside the writer
+READER_POOL_SIZE = 5
+
+# Parsed profiles kept in memory, revalidated against updated_at on read
+PROFILE_CACHE_SIZE = 512
+
+# Columns read back into a PlayerProfile, selected by name
+_PROFILE_COLUMNS = (
+    "user_id", "station_level", "station_name", "current_district",
+    "unlocked_districts", "owned_vehicles", "staff_roster", "owned_upgrades",
+    "active_policies", "heat_level", "reputation", "last_tick_ts",
+    "automation_enabled", "dashboard_message_id", "dashboard_channel_id",
+    "vehicle_cooldowns", "staff_cooldowns", "total_missions_completed",
+    "total_missions_failed", "total_income_earned", "total_expenses_paid",
+    "active_missions", "equipment_inventory", "equipment_assignments",
+    "updated_at",
+)
+_PROFILE_COLUMN_LIST = ", ".join(_PROFILE_COLUMNS)
+
+_SQL_SELECT_PROFILE = (
+    f"SELECT {_PROFILE_COLUMN_LIST} FROM player_profiles WHERE user_id = ?"
+)
+
+_SQL_SELECT_UPDATED_AT = "SELECT updated_at FROM player_profiles WHERE user_id = ?"
+
+_SQL_INSERT_PROFILE = """
+    INSERT INTO player_profiles (
+        user_id, station_level, station_name, current_district,
+        unlocked_districts, owned_vehicles, staff_roster,
+        owned_upgrades, active_policies, active_missions,
+        equipment_inventory, equipment_assignments,
+        heat_level, reputation, last_tick_ts, automation_enabled
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Columns written by save_profile, in their full-update order
+_UPDATE_COLUMNS = (
+    "station_level", "station_name", "current_district", "unlocked_districts",
+    "owned_vehicles", "staff_roster", "owned_upgrades", "active_policies",
+    "active_missions", "equipment_inventory", "equipment_assignments",
+    "heat_level", "reputation", "last_tick_ts", "automation_enabled",
+    "dashboard_message_id", "dashboard_channel_id", "vehicle_cooldowns",
+    "staff_cooldowns", "total_missions_completed", "total_missions_failed",
+    "total_income_earned", "total_expenses_paid",
+)
+
+
+@lru_cache(maxsize=128)
+def _update_sql(columns: Tuple[str, ...]) -> str:
+    """Build an UPDATE statement touching only the given columns."""
+    assignments = ",\n        ".join(f"{column} = ?" for column in columns)
+    return (
+        f"UPDATE player_profiles SET\n        {assignments},\n"
+        "        updated_at = CURRENT_TIMESTAMP\n    WHERE user_id = ?"
+    )
+
+
+_SQL_UPDATE_PROFILE = _update_sql(_UPDATE_COLUMNS)
+
+
 class Repository:
     """Data access layer with concurrency safety."""
     
     def __init__(self, db_path: Path):
         self.db_path = db_path
-        self._locks: Dict[int, asyncio.Lock] = {}  # user_id -> lock
-        self._global_lock = asyncio.Lock()
+        self._writer: Optional[aiosqlite.Connection] = None
+        self._readers: asyncio.Queue = asyncio.Queue()
+        self._reader_connections: List[aiosqlite.Connection] = []
+        self._write_lock = asyncio.Lock()
+        # user_id -> (updated_at, parsed profile)
+        self._profile_cache: "OrderedDict[int, Tuple[str, PlayerProfile]]" = OrderedDict()
+        # Bumped on every write so reads that overlap a write are not cached;
+        # updated_at only has one-second resolution
+        self._write_generation = 0
     
-    def _get_user_lock(self, user_id: int) -> asyncio.Lock:
-        """Get or create a lock for a specific user."""
-        if user_id not in self._locks:
-            self._locks[user_id] = asyncio.Lock()
-        return self._locks[user_id]
+    async def _open_connection(self) -> aiosqlite.Connection:
+        """Open a connection with the standard PRAGMAs applied."""
+        db = await aiosqlite.connect(self.db_path)
+        db.row_factory = aiosqlite.Row
+        for pragma in CONNECTION_PRAGMAS:
+            await db.execute(pragma)
+        return db
+    
+    async def connect(self):
+        """Open the writer connection and the reader pool."""
+        if self._writer is not None:
+            return
+        # The writer switches the database to WAL before any reader attaches
+        self._writer = await self._open_connection()
+        for _ in range(READER_POOL_SIZE):
+            reader = await self._open_connection()
+            self._reader_connections.append(reader)
+            self._readers.put_nowait(reader)
+        log.info(
+            f"Opened database connections to {self.db_path} "
+            f"(1 writer, {READER_POOL_SIZE} readers)"
+        )
+    
+    async def close(self):
+        """Close the writer connection and the reader pool."""
+        if self._writer is None:
+            return
+        for reader in self._reader_connections:
+            await reader.close()
+        self._reader_connections.clear()
+        self._readers = asyncio.Queue()
+        await self._writer.close()
+        self._writer = None
+        log.info("Closed database connections")
+    
+    @asynccontextmanager
+    async def _reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a reader connection from the pool."""
+        db = await self._readers.get()
+        try:
+            yield db
+        finally:
+            self._readers.put_nowait(db)
+    
+    @asynccontextmanager
+    async def _write_transaction(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Run a write transaction on the writer connection.
+
+        The writer connection is shared, so transactions on it are serialized
+        in-process; BEGIN IMMEDIATE takes the database write lock up front so
+        concurrent writers wait on busy_timeout instead of failing mid-way.
+        """
+        async with self._write_lock:
+            await self._writer.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._writer
+            except BaseException:
+                await self._writer.rollback()
+                raise
+            await self._writer.commit()
     
     async def get_profile(self, user_id: int) -> Optional[PlayerProfile]:
-        """Get a player profile by user ID."""
-        async with self._get_user_lock(user_id):
-            async with aiosqlite.connect(self.db_path) as db:
-                async with db.execute(
-                    "SELECT * FROM player_profiles WHERE user_id = ?",
-                    (user_id,)
-                ) as cursor:
-                    row = await cursor.fetchone()
-                    if row is None:
-                        return None
-                    return self._row_to_profile(row)
+        """Get a player profile by user ID.
+
+        Parsed profiles are cached; a repeat read only fetches ``updated_at``
+        and returns a copy of the cached profile when the row is unchanged.
+        """
+        cached = self._profile_cache.get(user_id)
+        generation = self._write_generation
+        async with self._reader() as db:
+            if cached is not None:
+                async with db.execute(_SQL_SELECT_UPDATED_AT, (user_id,)) as cursor:
+                    stamp = await cursor.fetchone()
+                if stamp is None:
+                    self._profile_cache.pop(user_id, None)
+                    return None
+                if stamp["updated_at"] == cached[0]:
+                    self._profile_cache.move_to_end(user_id)
+                    return cached[1].copy()
+            async with db.execute(_SQL_SELECT_PROFILE, (user_id,)) as cursor:
+                row = await cursor.fetchone()
+        if row is None:
+            self._profile_cache.pop(user_id, None)
+            return None
+        profile = self._row_to_profile(row)
+        if generation != self._write_generation:
+            return profile
+        self._cache_profile(row["updated_at"], profile)
+        return profile.copy()
+    
+    def _invalidate_profile(self, user_id: int):
+        """Drop a cached profile after it has been written."""
+        self._write_generation += 1
+        self._profile_cache.pop(user_id, None)
+    
+    def _cache_profile(self, updated_at: str, profile: PlayerProfile):
+        """Remember a parsed profile, evicting the least recently used entry."""
+        self._profile_cache[profile.user_id] = (updated_at, profile)
+        self._profile_cache.move_to_end(profile.user_id)
+        if len(self._profile_cache) > PROFILE_CACHE_SIZE:
+            self._profile_cache.popitem(last=False)
+    
+    def _new_profile_params(self, profile: PlayerProfile) -> tuple:
+        """Build INSERT parameters for a freshly created profile."""
+        return (
+            profile.user_id, profile.station_level, profile.station_name,
+            profile.current_district,
+            _dumps_sorted(profile.unlocked_districts),
+            _dumps(profile.owned_vehicles),
+            _dumps(profile.staff_roster),
+            _dumps_sorted(profile.owned_upgrades),
+            _dumps_sorted(profile.active_policies),
+            _dumps([]),
+            _dumps(profile.equipment_inventory),
+            _dumps(profile.equipment_assignments),
+            profile.heat_level, profile.reputation,
+            None,  # last_tick_ts
+            0  # automation_enabled
+        )
     
     async def create_profile(self, user_id: int) -> PlayerProfile:
         """Create a new player profile."""
-        async with self._get_user_lock(user_id):
-            profile = PlayerProfile(user_id=user_id)
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute(
-                    """
-                    INSERT INTO player_profiles (
-                        user_id, station_level, station_name, current_district,
-                        unlocked_districts, owned_vehicles, staff_roster,
-                        owned_upgrades, active_policies, active_missions,
-                        equipment_inventory, equipment_assignments,
-                        heat_level, reputation, last_tick_ts, automation_enabled
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        user_id, profile.station_level, profile.station_name,
-                        profile.current_district,
-                        json.dumps(profile.unlocked_districts),
-                        json.dumps(profile.owned_vehicles),
-                        json.dumps(profile.staff_roster),
-                        json.dumps(profile.owned_upgrades),
-                        json.dumps(profile.active_policies),
-                        json.dumps([]),
-                        json.dumps(profile.equipment_inventory),
-                        json.dumps(profile.equipment_assignments),
-                        profile.heat_level, profile.reputation,
-                        None,  # last_tick_ts
-                        0  # automation_enabled
-                    )
-                )
-                await db.commit()
-            log.info(f"Created new profile for user {user_id}")
-            return profile
+        profile = PlayerProfile(user_id=user_id)
+        async with self._write_transaction() as db:
+            await db.execute(_SQL_INSERT_PROFILE, self._new_profile_params(profile))
+        self._invalidate_profile(user_id)
+        log.info(f"Created new profile for user {user_id}")
+        return profile
     
     async def get_or_create_profile(self, user_id: int) -> PlayerProfile:
-        """Get existing profile or create new one."""
+        """Get existing profile or create new one.
+
+        Existing players are served by ``get_profile`` (usually just the cached
+        ``updated_at`` check). Missing profiles are created with a single
+        ``INSERT ... ON CONFLICT DO UPDATE ... RETURNING``, which returns the row
+        whether this call or a concurrent one inserted it.
+        """
         profile = await self.get_profile(user_id)
-        if profile is None:
-            profile = await self.create_profile(user_id)
-        return profile
+        if profile is not None:
+            return profile
+
+        params = self._new_profile_params(PlayerProfile(user_id=user_id))
+        async with self._write_transaction() as db:
+            async with db.execute(
+                _SQL_INSERT_PROFILE
+                + " ON CONFLICT(user_id) DO UPDATE SET user_id = excluded.user_id"
+                + f" RETURNING {_PROFILE_COLUMN_LIST}",
+                params
+            ) as cursor:
+                row = await cursor.fetchone()
+        self._invalidate_profile(user_id)
+        log.info(f"Created new profile for user {user_id}")
+        return self._row_to_profile(row)
+    
+    def _profile_params(
+        self, profile: PlayerProfile, columns: Tuple[str, ...] = _UPDATE_COLUMNS
+    ) -> tuple:
+        """Build UPDATE parameters for the given profile columns."""
+        params = []
+        for column in columns:
+            value = getattr(profile, column)
+            encoder = _COLUMN_ENCODERS.get(column)
+            params.append(encoder(value) if encoder else value)
+        params.append(profile.user_id)
+        return tuple(params)
     
     async def save_profile(self, profile: PlayerProfile):
-        """Save a player profile."""
-        async with self._get_user_lock(profile.user_id):
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute(
-                    """
-                    UPDATE player_profiles SET
-                        station_level = ?,
-                        station_name = ?,
-                        current_district = ?,
-                        unlocked_districts = ?,
-                        owned_vehicles = ?,
-                        staff_roster = ?,
-                        owned_upgrades = ?,
-                        active_policies = ?,
-                        active_missions = ?,
-                        equipment_inventory = ?,
-                        equipment_assignments = ?,
-                        heat_level = ?,
-                        reputation = ?,
-                        last_tick_ts = ?,
-                        automation_enabled = ?,
-                        dashboard_message_id = ?,
-                        dashboard_channel_id = ?,
-                        vehicle_cooldowns = ?,
-                        staff_cooldowns = ?,
-                        total_missions_completed = ?,
-                        total_missions_failed = ?,
-                        total_income_earned = ?,
-                        total_expenses_paid = ?,
-                        updated_at = CURRENT_TIMESTAMP
-                    WHERE user_id = ?
-                    """,
-                    (
-                        profile.station_level,
-                        profile.station_name,
-                        profile.current_district,
-                        json.dumps(profile.unlocked_districts),
-                        json.dumps(profile.owned_vehicles),
-                        json.dumps(profile.staff_roster),
-                        json.dumps(profile.owned_upgrades),
-                        json.dumps(profile.active_policies),
-                        json.dumps(
-                            [
-                                {
-                                    "mission_id": mission.mission_id,
-                                    "name": mission.name,
-                                    "ends_at": mission.ends_at.isoformat(),
-                                    "dispatched_at": mission.dispatched_at.isoformat(),
-                                    "operating_cost": mission.operating_cost,
-                                    "potential_reward": mission.potential_reward,
-                                    "success_chance": mission.success_chance,
-                                    "heat_change": mission.heat_change,
-                                    "reputation_success": mission.reputation_success,
-                                    "reputation_failure": mission.reputation_failure,
-                                }
-                                for mission in profile.active_missions
-                            ]
-                        ),
-                        json.dumps(profile.equipment_inventory),
-                        json.dumps(profile.equipment_assignments),
-                        profile.heat_level,
-                        profile.reputation,
-                        profile.last_tick_ts.isoformat() if profile.last_tick_ts else None,
-                        1 if profile.automation_enabled else 0,
-                        profile.dashboard_message_id,
-                        profile.dashboard_channel_id,
-                        json.dumps(
-                            {
-                                key: [ts.isoformat() for ts in timestamps]
-                                for key, timestamps in profile.vehicle_cooldowns.items()
-                            }
-                        ),
-                        json.dumps(
-                            {
-                                key: [ts.isoformat() for ts in timestamps]
-                                for key, timestamps in profile.staff_cooldowns.items()
-                            }
-                        ),
-                        profile.total_missions_completed,
-                        profile.total_missions_failed,
-                        profile.total_income_earned,
-                        profile.total_expenses_paid,
-                        profile.user_id
-                    )
-                )
-                await db.commit()
+        """Save the fields of a player profile that changed since it was loaded."""
+        dirty = profile.dirty_fields
+        columns = tuple(column for column in _UPDATE_COLUMNS if column in dirty)
+        if not columns:
+            return
+        async with self._write_transaction() as db:
+            await db.execute(_update_sql(columns), self._profile_params(profile, columns))
+        profile.mark_clean()
+        self._invalidate_profile(profile.user_id)
+    
+    async def save_profiles(self, profiles: List[PlayerProfile]):
+        """Save several player profiles in one transaction."""
+        profiles = [profile for profile in profiles if profile.dirty_fields]
+        if not profiles:
+            return
+        rows = [self._profile_params(profile) for profile in profiles]
+        async with self._write_transaction() as db:
+            await db.executemany(_SQL_UPDATE_PROFILE, rows)
+        for profile in profiles:
+            profile.mark_clean()
+            self._invalidate_profile(profile.user_id)
     
     def _row_to_profile(self, row) -> PlayerProfile:
         """Convert database row to PlayerProfile object."""
         # Parse JSON fields
-        unlocked_districts = json.loads(row[4]) if row[4] else ["downtown"]
-        owned_vehicles = json.loads(row[5]) if row[5] else {}
-        staff_roster = json.loads(row[6]) if row[6] else {}
-        owned_upgrades = json.loads(row[7]) if row[7] else []
-        active_policies = json.loads(row[8]) if row[8] else []
+        # Content IDs are interned so every profile shares one copy of each key
+        unlocked_districts = (
+            set(map(intern_id, _loads(row["unlocked_districts"])))
+            if row["unlocked_districts"]
+            else {"downtown"}
+        )
+        owned_vehicles = _intern_keys(_load_json_column(row["owned_vehicles"], dict))
+        staff_roster = _intern_keys(_load_json_column(row["staff_roster"], dict))
+        owned_upgrades = set(map(intern_id, _load_json_column(row["owned_upgrades"], list)))
+        active_policies = set(map(intern_id, _load_json_column(row["active_policies"], list)))
         
         # Parse datetime fields
-        last_tick_ts = datetime.fromisoformat(row[11]) if row[11] else None
+        last_tick_ts = datetime.fromisoformat(row["last_tick_ts"]) if row["last_tick_ts"] else None
         
         # Parse cooldown fields
-        vehicle_cooldowns = {}
-        if row[15]:
-            vehicle_cooldowns_data = json.loads(row[15])
-            for key, value in vehicle_cooldowns_data.items():
-                if isinstance(value, list):
-                    vehicle_cooldowns[key] = [datetime.fromisoformat(ts) for ts in value if ts]
-                elif value:
-                    vehicle_cooldowns[key] = [datetime.fromisoformat(value)]
-
-        staff_cooldowns = {}
-        if row[16]:
-            staff_cooldowns_data = json.loads(row[16])
-            for key, value in staff_cooldowns_data.items():
-                if isinstance(value, list):
-                    staff_cooldowns[key] = [datetime.fromisoformat(ts) for ts in value if ts]
-                elif value:
-                    staff_cooldowns[key] = [datetime.fromisoformat(value)]
+        vehicle_cooldowns = _intern_keys(_decode_cooldowns(row["vehicle_cooldowns"]))
+        staff_cooldowns = _intern_keys(_decode_cooldowns(row["staff_cooldowns"]))
         
-        active_missions = []
-        if len(row) > 23 and row[23]:
-            active_missions_data = json.loads(row[23])
-            active_missions = [
-                ActiveMission(
-                    mission_id=mission.get("mission_id", ""),
-                    name=mission.get("name", "Unknown Mission"),
-                    ends_at=datetime.fromisoformat(mission["ends_at"]),
-                    dispatched_at=datetime.fromisoformat(mission.get("dispatched_at", mission["ends_at"])),
-                    operating_cost=int(mission.get("operating_cost", 0)),
-                    potential_reward=int(mission.get("potential_reward", 0)),
-                    success_chance=int(mission.get("success_chance", 50)),
-                    heat_change=int(mission.get("heat_change", 0)),
-                    reputation_success=int(mission.get("reputation_success", 0)),
-                    reputation_failure=int(mission.get("reputation_failure", 0)),
-                )
-                for mission in active_missions_data
-                if mission.get("ends_at")
-            ]
-
-        equipment_inventory = {}
-        if len(row) > 24 and row[24]:
-            equipment_inventory = json.loads(row[24])
+        active_missions = [
+            ActiveMission(
+                mission_id=mission.get("mission_id", ""),
+                name=mission.get("name", "Unknown Mission"),
+                ends_at=datetime.fromisoformat(mission["ends_at"]),
+                dispatched_at=datetime.fromisoformat(mission.get("dispatched_at", mission["ends_at"])),
+                operating_cost=int(mission.get("operating_cost", 0)),
+                potential_reward=int(mission.get("potential_reward", 0)),
+                success_chance=int(mission.get("success_chance", 50)),
+                heat_change=int(mission.get("heat_change", 0)),
+                reputation_success=int(mission.get("reputation_success", 0)),
+                reputation_failure=int(mission.get("reputation_failure", 0)),
+            )
+            for mission in _load_json_column(row["active_missions"], list)
+            if mission.get("ends_at")
+        ]
+
+        equipment_inventory = _intern_keys(_load_json_column(row["equipment_inventory"], dict))
 
         equipment_assignments = {"vehicles": {}, "staff": {}}
-        if len(row) > 25 and row[25]:
+        if row["equipment_assignments"]:
             try:
-                loaded_assignments = json.loads(row[25])
+                loaded_assignments = _loads(row["equipment_assignments"])
                 if isinstance(loaded_assignments, dict):
-                    equipment_assignments.update(loaded_assignments)
+                    equipment_assignments.update(
+                        (target, {intern_id(key): _intern_keys(counts) for key, counts in bucket.items()})
+                        for target, bucket in loaded_assignments.items()
+                    )
             except json.JSONDecodeError:
                 pass
 
         profile = PlayerProfile(
-            user_id=row[0],
-            station_level=row[1],
-            station_name=row[2],
-            current_district=row[3],
+            user_id=row["user_id"],
+            station_level=row["station_level"],
+            station_name=row["station_name"],
+            current_district=row["current_district"],
             unlocked_districts=unlocked_districts,
             owned_vehicles=owned_vehicles,
             staff_roster=staff_roster,
             owned_upgrades=owned_upgrades,
             active_policies=active_policies,
-            heat_level=row[9],
-            reputation=row[10],
+            heat_level=row["heat_level"],
+            reputation=row["reputation"],
             last_tick_ts=last_tick_ts,
-            automation_enabled=bool(row[12]),
-            dashboard_message_id=row[13],
-            dashboard_channel_id=row[14],
+            automation_enabled=bool(row["automation_enabled"]),
+            dashboard_message_id=row["dashboard_message_id"],
+            dashboard_channel_id=row["dashboard_channel_id"],
             vehicle_cooldowns=vehicle_cooldowns,
             staff_cooldowns=staff_cooldowns,
-            total_missions_completed=row[17],
-            total_missions_failed=row[18],
-            total_income_earned=row[19],
-            total_expenses_paid=row[20],
+            total_missions_completed=row["total_missions_completed"],
+            total_missions_failed=row["total_missions_failed"],
+            total_income_earned=row["total_income_earned"],
+            total_expenses_paid=row["total_expenses_paid"],
             active_missions=active_missions,
             equipment_inventory=equipment_inventory,
             equipment_assignments=equipment_assignments,
@@ -7,6 +7,7 @@ from .profile import (
     ActiveMission,
     DISPATCH_BASE_TABLES,
     DISPATCHER_STAFF_ID,
+    intern_id,
 )
 from .mission import Mission
 from .vehicle import Vehicle
@@ -21,6 +22,7 @@ __all__ = [
     "ActiveMission",
     "DISPATCH_BASE_TABLES",
     "DISPATCHER_STAFF_ID",
+    "intern_id",
     "Mission",
     "Vehicle",
     "District",
@@ -6,7 +6,7 @@ Author: BrandjuhNL
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class District:
     """Represents an unlockable district/zone."""
     
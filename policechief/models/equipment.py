@@ -4,10 +4,10 @@ Author: BrandjuhNL
 """
 
 from dataclasses import dataclass, field
-from typing import List
+from typing import FrozenSet, Tuple
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Equipment:
     """Represents an equipment item that can be slotted on vehicles or staff."""
 
@@ -21,25 +21,40 @@ class Equipment:
     effect_value: float
     slot_size: int = 1
     min_station_level: int = 1
-    allowed_vehicle_types: List[str] = field(default_factory=list)
-    allowed_staff_types: List[str] = field(default_factory=list)
+    allowed_vehicle_types: Tuple[str, ...] = ()
+    allowed_staff_types: Tuple[str, ...] = ()
+
+    # Lookup helpers derived once in __post_init__
+    _allowed_vehicle_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _allowed_staff_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _targets_vehicle: bool = field(init=False, repr=False, compare=False)
+    _targets_staff: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Content packs provide JSON arrays; store tuples so equipment stays hashable
+        object.__setattr__(self, "allowed_vehicle_types", tuple(self.allowed_vehicle_types))
+        object.__setattr__(self, "allowed_staff_types", tuple(self.allowed_staff_types))
+        object.__setattr__(self, "_allowed_vehicle_set", frozenset(self.allowed_vehicle_types))
+        object.__setattr__(self, "_allowed_staff_set", frozenset(self.allowed_staff_types))
+        object.__setattr__(self, "_targets_vehicle", self.target in ("vehicle", "any"))
+        object.__setattr__(self, "_targets_staff", self.target in ("staff", "any"))
 
     def applies_to_vehicle(self, vehicle_type: str) -> bool:
         """Return True if this equipment can be slotted on the given vehicle type."""
-        if self.target not in ("vehicle", "any"):
+        if not self._targets_vehicle:
             return False
 
-        if self.allowed_vehicle_types and vehicle_type not in self.allowed_vehicle_types:
+        if self._allowed_vehicle_set and vehicle_type not in self._allowed_vehicle_set:
             return False
 
         return True
 
     def applies_to_staff(self, staff_type: str) -> bool:
         """Return True if this equipment can be slotted on the given staff type."""
-        if self.target not in ("staff", "any"):
+        if not self._targets_staff:
             return False
 
-        if self.allowed_staff_types and staff_type not in self.allowed_staff_types:
+        if self._allowed_staff_set and staff_type not in self._allowed_staff_set:
             return False
 
         return True
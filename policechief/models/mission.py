@@ -4,11 +4,11 @@ Author: BrandjuhNL
 """
 
 from collections import Counter
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import Tuple
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Mission:
     """Represents a dispatchable mission/call."""
     
@@ -16,8 +16,8 @@ class Mission:
     name: str
     description: str
     district: str  # Which district this mission appears in
-    required_vehicle_types: List[str]  # Vehicle type IDs required
-    required_staff_types: List[str]  # Staff type IDs required
+    required_vehicle_types: Tuple[str, ...]  # Vehicle type IDs required
+    required_staff_types: Tuple[str, ...]  # Staff type IDs required
     base_reward: int  # Base credit reward
     base_duration: int  # Base duration in minutes
     base_success_chance: int  # Base success % (0-100)
@@ -26,6 +26,24 @@ class Mission:
     reputation_change_success: int  # Reputation change on success
     reputation_change_failure: int  # Reputation change on failure
     min_station_level: int = 1  # Minimum station level to unlock
+
+    # Derived from the requirement lists once in __post_init__
+    # (type, quantity) pairs in first-seen order
+    required_vehicle_counts: Tuple[Tuple[str, int], ...] = field(init=False, repr=False, compare=False)
+    required_staff_counts: Tuple[Tuple[str, int], ...] = field(init=False, repr=False, compare=False)
+    _requirements_text: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Content packs provide JSON arrays; store tuples so missions stay hashable
+        object.__setattr__(self, "required_vehicle_types", tuple(self.required_vehicle_types))
+        object.__setattr__(self, "required_staff_types", tuple(self.required_staff_types))
+        object.__setattr__(
+            self, "required_vehicle_counts", tuple(Counter(self.required_vehicle_types).items())
+        )
+        object.__setattr__(
+            self, "required_staff_counts", tuple(Counter(self.required_staff_types).items())
+        )
+        object.__setattr__(self, "_requirements_text", self._build_requirements_text())
     
     def get_display_name(self) -> str:
         """Get formatted display name."""
@@ -33,19 +51,21 @@ class Mission:
 
     def get_requirements_text(self) -> str:
         """Get human-readable requirements."""
+        return self._requirements_text
+
+    def _build_requirements_text(self) -> str:
+        """Render the requirements summary from the precomputed counts."""
         parts = []
-        if self.required_vehicle_types:
-            vehicle_counts = Counter(self.required_vehicle_types)
+        if self.required_vehicle_counts:
             vehicle_text = ", ".join(
                 f"{count}x {vehicle_type}" if count > 1 else vehicle_type
-                for vehicle_type, count in vehicle_counts.items()
+                for vehicle_type, count in self.required_vehicle_counts
             )
             parts.append(f"Vehicles: {vehicle_text}")
-        if self.required_staff_types:
-            staff_counts = Counter(self.required_staff_types)
+        if self.required_staff_counts:
             staff_text = ", ".join(
                 f"{count}x {staff_type}" if count > 1 else staff_type
-                for staff_type, count in staff_counts.items()
+                for staff_type, count in self.required_staff_counts
             )
             parts.append(f"Staff: {staff_text}")
         parts.append(f"Min Level: {self.min_station_level}")
@@ -3,17 +3,17 @@ Policy model
 Author: BrandjuhNL
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Policy:
     """Represents an automation policy for auto-dispatch."""
     
     id: str
     name: str
     description: str
-    mission_filters: dict  # Criteria for which missions to auto-dispatch
+    mission_filters: dict = field(hash=False)  # Criteria for which missions to auto-dispatch
     priority: int  # Higher priority policies run first
     min_station_level: int = 1
     
@@ -3,13 +3,19 @@ Player profile model
 Author: BrandjuhNL
 """
 
+import bisect
+import heapq
+import sys
+import time
 from collections import Counter
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from operator import attrgetter
 from datetime import datetime
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Set, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover - only for type hints
-    from .staff import Staff
+    from .equipment import Equipment
+    from .upgrade import Upgrade
     from .vehicle import Vehicle
 
 
@@ -23,7 +29,41 @@ DISPATCHER_STAFF_ID = "dispatcher"
 # Special user ID with full feature access (e.g., automation without upgrade)
 SPECIAL_FEATURE_ACCESS_USER_ID = 132620654087241729
 
-@dataclass
+def intern_id(value: str) -> str:
+    """Return the canonical shared copy of a content ID string."""
+    return sys.intern(value)
+
+
+# (catalog, catalog size, equipment_id -> slot_size) for the last catalog seen
+_slot_size_cache: Optional[Tuple[Dict[str, "Equipment"], int, Dict[str, int]]] = None
+
+
+def _slot_sizes(equipment_catalog: Dict[str, "Equipment"]) -> Dict[str, int]:
+    """Flat slot-size lookup for an equipment catalog, built once per catalog."""
+    global _slot_size_cache
+    cached = _slot_size_cache
+    if cached is not None and cached[0] is equipment_catalog and cached[1] == len(equipment_catalog):
+        return cached[2]
+    sizes = {equipment_id: item.slot_size for equipment_id, item in equipment_catalog.items()}
+    _slot_size_cache = (equipment_catalog, len(equipment_catalog), sizes)
+    return sizes
+
+
+_EPOCH = datetime(1970, 1, 1)
+_MISSION_END = attrgetter("ends_at_ts")
+
+
+@dataclass(frozen=True, slots=True)
+class UpgradeEffects:
+    """Combined effect of a profile's owned upgrades."""
+
+    cost_multiplier: float = 1.0
+    income_multiplier: float = 1.0
+    success_bonus: float = 0.0
+    dispatch_tables: int = 0
+
+
+@dataclass(frozen=True, slots=True)
 class ActiveMission:
     """Represents a mission currently in progress."""
 
@@ -37,15 +77,23 @@ class ActiveMission:
     heat_change: int
     reputation_success: int
     reputation_failure: int
+    # Epoch seconds of ends_at (stored as naive UTC), for cheap comparisons
+    ends_at_ts: float = field(init=False, repr=False, compare=False)
 
-    def remaining_minutes(self, now: Optional[datetime] = None) -> int:
-        """Return remaining minutes until completion (minimum 0)."""
-        now = now or datetime.utcnow()
-        remaining = self.ends_at - now
-        return max(0, int(remaining.total_seconds() // 60))
+    def __post_init__(self):
+        object.__setattr__(self, "ends_at_ts", (self.ends_at - _EPOCH).total_seconds())
+
+    def remaining_minutes(self, now_ts: Optional[float] = None) -> int:
+        """Return remaining minutes until completion (minimum 0).
+
+        now_ts is a Unix timestamp such as time.time().
+        """
+        if now_ts is None:
+            now_ts = time.time()
+        return max(0, int((self.ends_at_ts - now_ts) // 60))
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerProfile:
     """Represents a player's police station profile."""
 
@@ -53,16 +101,16 @@ class PlayerProfile:
     station_level: int = 1
     station_name: str = "Metro Police Department"
     current_district: str = "downtown"
-    unlocked_districts: List[str] = field(default_factory=lambda: ["downtown"])
+    unlocked_districts: Set[str] = field(default_factory=lambda: {"downtown"})
     owned_vehicles: Dict[str, int] = field(default_factory=dict)  # vehicle_id -> quantity
     staff_roster: Dict[str, int] = field(default_factory=dict)  # staff_id -> quantity
-    owned_upgrades: List[str] = field(default_factory=list)  # upgrade_ids
-    active_policies: List[str] = field(default_factory=list)  # policy_ids
+    owned_upgrades: Set[str] = field(default_factory=set)  # upgrade_ids
+    active_policies: Set[str] = field(default_factory=set)  # policy_ids
     equipment_inventory: Dict[str, int] = field(default_factory=dict)  # equipment_id -> quantity
     equipment_assignments: Dict[str, Dict[str, Dict[str, int]]] = field(
         default_factory=lambda: {"vehicles": {}, "staff": {}}
     )  # target -> id -> equipment counts
-    active_missions: List[ActiveMission] = field(default_factory=list)
+    active_missions: List[ActiveMission] = field(default_factory=list)  # sorted by ends_at
     heat_level: int = 0  # 0-100
     reputation: int = 50  # 0-100
     last_tick_ts: Optional[datetime] = None
@@ -71,8 +119,9 @@ class PlayerProfile:
     dashboard_channel_id: Optional[int] = None
     
     # Cooldowns and downtime tracking
-    vehicle_cooldowns: Dict[str, List[datetime]] = field(default_factory=dict)  # vehicle_id -> ready_times
-    staff_cooldowns: Dict[str, List[datetime]] = field(default_factory=dict)  # staff_id -> ready_times
+    # id -> min-heap of (ready_at, count) runs, one run per allocation batch
+    vehicle_cooldowns: Dict[str, List[Tuple[datetime, int]]] = field(default_factory=dict)
+    staff_cooldowns: Dict[str, List[Tuple[datetime, int]]] = field(default_factory=dict)
     
     # Statistics
     total_missions_completed: int = 0
@@ -80,6 +129,79 @@ class PlayerProfile:
     total_income_earned: int = 0
     total_expenses_paid: int = 0
 
+    # Fields changed since the profile was loaded or last saved
+    _dirty: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    # equipment_id -> pieces slotted anywhere, kept in step with equipment_assignments
+    _assigned_totals: Counter = field(default_factory=Counter, init=False, repr=False, compare=False)
+    # id -> units still counted in the cooldown runs
+    _busy_vehicles: Counter = field(default_factory=Counter, init=False, repr=False, compare=False)
+    _busy_staff: Counter = field(default_factory=Counter, init=False, repr=False, compare=False)
+    # Running sums of owned_vehicles / staff_roster
+    _total_vehicles: int = field(default=0, init=False, repr=False, compare=False)
+    _total_staff: int = field(default=0, init=False, repr=False, compare=False)
+    # (vehicle catalog, seating, prisoners); cleared whenever the fleet changes
+    _fleet_capacity: Optional[Tuple[Dict[str, "Vehicle"], int, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # (upgrade catalog, effects); cleared whenever owned_upgrades changes
+    _upgrade_effects: Optional[Tuple[Dict[str, "Upgrade"], UpgradeEffects]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self._total_vehicles = sum(self.owned_vehicles.values())
+        self._total_staff = sum(self.staff_roster.values())
+        self._busy_vehicles = self._index_cooldowns(self.vehicle_cooldowns)
+        self._busy_staff = self._index_cooldowns(self.staff_cooldowns)
+        self._rebuild_assigned_totals()
+        self.active_missions.sort(key=_MISSION_END)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name == "owned_upgrades":
+            # Effects are derived from the owned set, so a new set invalidates them
+            object.__setattr__(self, "_upgrade_effects", None)
+        if not name.startswith("_"):
+            # _dirty does not exist yet while __init__ assigns the fields
+            dirty = getattr(self, "_dirty", None)
+            if dirty is not None:
+                dirty.add(name)
+
+    @property
+    def dirty_fields(self) -> FrozenSet[str]:
+        """Fields changed since the profile was loaded or last saved."""
+        return frozenset(self._dirty)
+
+    def mark_dirty(self, *names: str):
+        """Flag fields that were modified in place."""
+        self._dirty.update(names)
+
+    def mark_clean(self):
+        """Forget pending changes once they have been persisted."""
+        self._dirty.clear()
+
+    def copy(self) -> "PlayerProfile":
+        """Return a copy whose containers can be mutated independently."""
+        clone = replace(
+            self,
+            unlocked_districts=set(self.unlocked_districts),
+            owned_vehicles=dict(self.owned_vehicles),
+            staff_roster=dict(self.staff_roster),
+            owned_upgrades=set(self.owned_upgrades),
+            active_policies=set(self.active_policies),
+            equipment_inventory=dict(self.equipment_inventory),
+            equipment_assignments={
+                target: {key: dict(counts) for key, counts in bucket.items()}
+                for target, bucket in self.equipment_assignments.items()
+            },
+            # Active missions are never modified in place
+            active_missions=list(self.active_missions),
+            vehicle_cooldowns={key: list(runs) for key, runs in self.vehicle_cooldowns.items()},
+            staff_cooldowns={key: list(runs) for key, runs in self.staff_cooldowns.items()},
+        )
+        clone._dirty = set(self._dirty)
+        return clone
+
     def has_automation_access(self) -> bool:
         """Check if automation features should be available for the profile."""
         return self.has_upgrade("dispatch_center") or self.user_id == SPECIAL_FEATURE_ACCESS_USER_ID
@@ -91,6 +213,46 @@ class PlayerProfile:
     def has_district(self, district_id: str) -> bool:
         """Check if player has unlocked a district."""
         return district_id in self.unlocked_districts
+
+    def add_upgrade(self, upgrade_id: str):
+        """Record a purchased upgrade."""
+        if upgrade_id not in self.owned_upgrades:
+            self.owned_upgrades.add(upgrade_id)
+            self._upgrade_effects = None
+            self.mark_dirty("owned_upgrades")
+
+    def get_upgrade_effects(self, upgrades: Dict[str, "Upgrade"]) -> UpgradeEffects:
+        """Aggregate effects of the owned upgrades, cached per catalog."""
+        cached = self._upgrade_effects
+        if cached is not None and cached[0] is upgrades:
+            return cached[1]
+
+        cost_multiplier = 1.0
+        income_multiplier = 1.0
+        success_bonus = 0.0
+        dispatch_tables = 0
+        for upgrade_id in self.owned_upgrades:
+            upgrade = upgrades.get(upgrade_id)
+            if not upgrade:
+                continue
+            if upgrade.effect_type == "cost_reduction":
+                cost_multiplier *= (1.0 - upgrade.effect_value)
+            elif upgrade.effect_type == "income_boost":
+                income_multiplier *= (1.0 + upgrade.effect_value)
+            elif upgrade.effect_type == "success_boost":
+                success_bonus += upgrade.effect_value
+            elif upgrade.effect_type == "dispatch_capacity":
+                dispatch_tables += int(upgrade.effect_value)
+
+        effects = UpgradeEffects(cost_multiplier, income_multiplier, success_bonus, dispatch_tables)
+        self._upgrade_effects = (upgrades, effects)
+        return effects
+
+    def unlock_district(self, district_id: str):
+        """Record an unlocked district."""
+        if district_id not in self.unlocked_districts:
+            self.unlocked_districts.add(district_id)
+            self.mark_dirty("unlocked_districts")
     
     def get_vehicle_count(self, vehicle_id: str) -> int:
         """Get count of owned vehicles of a type."""
@@ -103,21 +265,21 @@ class PlayerProfile:
     @property
     def total_vehicle_count(self) -> int:
         """Total number of vehicles owned across all types."""
-        return sum(self.owned_vehicles.values())
+        return self._total_vehicles
 
     @property
     def total_staff_count(self) -> int:
         """Total number of staff across all roles."""
-        return sum(self.staff_roster.values())
+        return self._total_staff
+
+    def get_seated_staff_count(self, unseated_staff_ids: FrozenSet[str]) -> int:
+        """Total staff that require vehicle seats.
 
-    def get_seated_staff_count(self, staff_catalog: Dict[str, "Staff"]) -> int:
-        """Total staff that require vehicle seats."""
-        seated = 0
-        for staff_id, quantity in self.staff_roster.items():
-            staff = staff_catalog.get(staff_id)
-            if staff is None or staff.requires_vehicle:
-                seated += quantity
-        return seated
+        unseated_staff_ids lists the staff types that do not take a seat
+        (ContentLoader.unseated_staff_ids); anything else counts as seated.
+        """
+        roster = self.staff_roster
+        return self._total_staff - sum(roster.get(staff_id, 0) for staff_id in unseated_staff_ids)
 
     def get_vehicle_capacity_limit(self) -> Optional[int]:
         """Maximum vehicles allowed at the current station level."""
@@ -128,23 +290,29 @@ class PlayerProfile:
         limit = self.get_vehicle_capacity_limit()
         return limit is None or self.total_vehicle_count < limit
 
-    def get_staff_capacity(self, vehicles: Dict[str, "Vehicle"]) -> int:
-        """Calculate total staff that can be seated based on owned vehicles."""
-        capacity = 0
+    def _get_fleet_capacity(self, vehicles: Dict[str, "Vehicle"]) -> Tuple[int, int]:
+        """Seating and prisoner capacity of the fleet, cached per catalog."""
+        cached = self._fleet_capacity
+        if cached is not None and cached[0] is vehicles:
+            return cached[1], cached[2]
+
+        seating = 0
+        prisoners = 0
         for vehicle_id, quantity in self.owned_vehicles.items():
             vehicle = vehicles.get(vehicle_id)
             if vehicle:
-                capacity += vehicle.seating_capacity * quantity
-        return capacity
+                seating += vehicle.seating_capacity * quantity
+                prisoners += vehicle.prisoner_capacity * quantity
+        self._fleet_capacity = (vehicles, seating, prisoners)
+        return seating, prisoners
+
+    def get_staff_capacity(self, vehicles: Dict[str, "Vehicle"]) -> int:
+        """Calculate total staff that can be seated based on owned vehicles."""
+        return self._get_fleet_capacity(vehicles)[0]
 
     def get_prisoner_capacity(self, vehicles: Dict[str, "Vehicle"]) -> int:
         """Calculate total prisoner transport capacity based on owned vehicles."""
-        capacity = 0
-        for vehicle_id, quantity in self.owned_vehicles.items():
-            vehicle = vehicles.get(vehicle_id)
-            if vehicle:
-                capacity += vehicle.prisoner_capacity * quantity
-        return capacity
+        return self._get_fleet_capacity(vehicles)[1]
 
     def get_holding_cell_capacity(self) -> int:
         """Holding cell capacity for the current station level."""
@@ -152,40 +320,65 @@ class PlayerProfile:
     
     def add_vehicle(self, vehicle_id: str, quantity: int = 1):
         """Add vehicles to the fleet."""
+        vehicle_id = intern_id(vehicle_id)
         current = self.owned_vehicles.get(vehicle_id, 0)
         self.owned_vehicles[vehicle_id] = current + quantity
+        self._total_vehicles += quantity
+        self._fleet_capacity = None
+        self.mark_dirty("owned_vehicles")
 
     def remove_vehicle(self, vehicle_id: str, quantity: int = 1):
         """Remove vehicles from the fleet, clearing cooldowns when depleted."""
         current = self.owned_vehicles.get(vehicle_id, 0)
         if quantity >= current:
             self.owned_vehicles.pop(vehicle_id, None)
+            self._total_vehicles -= current
+            self._fleet_capacity = None
             self.vehicle_cooldowns.pop(vehicle_id, None)
+            self._busy_vehicles.pop(vehicle_id, None)
             self._ensure_assignment_buckets()
-            self.equipment_assignments.get("vehicles", {}).pop(vehicle_id, None)
+            released = self.equipment_assignments["vehicles"].pop(vehicle_id, None)
+            if released:
+                self._release_assigned(released)
+            self.mark_dirty("owned_vehicles", "vehicle_cooldowns", "equipment_assignments")
         elif current > 0:
             self.owned_vehicles[vehicle_id] = current - quantity
+            self._total_vehicles -= quantity
+            self._fleet_capacity = None
+            self.mark_dirty("owned_vehicles")
 
     def add_staff(self, staff_id: str, quantity: int = 1):
         """Add staff to the roster."""
+        staff_id = intern_id(staff_id)
         current = self.staff_roster.get(staff_id, 0)
         self.staff_roster[staff_id] = current + quantity
+        self._total_staff += quantity
+        self.mark_dirty("staff_roster")
 
     def add_equipment(self, equipment_id: str, quantity: int = 1):
         """Add equipment pieces to the shared inventory."""
+        equipment_id = intern_id(equipment_id)
         current = self.equipment_inventory.get(equipment_id, 0)
         self.equipment_inventory[equipment_id] = current + quantity
+        self.mark_dirty("equipment_inventory")
 
     def remove_staff(self, staff_id: str, quantity: int = 1):
         """Remove staff from the roster, clearing cooldowns when depleted."""
         current = self.staff_roster.get(staff_id, 0)
         if quantity >= current:
             self.staff_roster.pop(staff_id, None)
+            self._total_staff -= current
             self.staff_cooldowns.pop(staff_id, None)
+            self._busy_staff.pop(staff_id, None)
             self._ensure_assignment_buckets()
-            self.equipment_assignments.get("staff", {}).pop(staff_id, None)
+            released = self.equipment_assignments["staff"].pop(staff_id, None)
+            if released:
+                self._release_assigned(released)
+            self.mark_dirty("staff_roster", "staff_cooldowns", "equipment_assignments")
         elif current > 0:
             self.staff_roster[staff_id] = current - quantity
+            self._total_staff -= quantity
+            self.mark_dirty("staff_roster")
 
     def remove_equipment(self, equipment_id: str, quantity: int = 1):
         """Remove equipment from inventory without touching assignments."""
@@ -194,33 +387,82 @@ class PlayerProfile:
             self.equipment_inventory.pop(equipment_id, None)
         elif current > 0:
             self.equipment_inventory[equipment_id] = current - quantity
+        self.mark_dirty("equipment_inventory")
     
-    def _prune_cooldowns(self, cooldowns: Dict[str, List[datetime]]):
-        """Remove expired cooldown entries from a cooldown mapping."""
-        now = datetime.utcnow()
-        for key, entries in list(cooldowns.items()):
-            cooldowns[key] = [timestamp for timestamp in entries if timestamp > now]
-            if not cooldowns[key]:
-                cooldowns.pop(key, None)
-
-    def get_available_vehicle_count(self, vehicle_id: str) -> int:
+    @staticmethod
+    def _index_cooldowns(cooldowns: Dict[str, List[Tuple[datetime, int]]]) -> Counter:
+        """Heapify cooldown runs and total the busy units per key."""
+        busy = Counter()
+        for key, runs in cooldowns.items():
+            heapq.heapify(runs)
+            busy[key] = sum(count for _, count in runs)
+        return busy
+
+    def _prune_cooldowns(
+        self,
+        cooldowns: Dict[str, List[Tuple[datetime, int]]],
+        busy: Counter,
+        key: str,
+        now: Optional[datetime] = None,
+    ):
+        """Pop expired runs for one key from the front of its heap."""
+        runs = cooldowns.get(key)
+        if runs is None:
+            return
+        now = now or datetime.utcnow()
+        while runs and runs[0][0] <= now:
+            _, count = heapq.heappop(runs)
+            busy[key] -= count
+        if not runs:
+            del cooldowns[key]
+            busy.pop(key, None)
+
+    def _allocate(
+        self,
+        cooldowns: Dict[str, List[Tuple[datetime, int]]],
+        busy: Counter,
+        key: str,
+        quantity: int,
+        cooldown_end: datetime,
+    ):
+        """Record a batch of units as busy until cooldown_end."""
+        heapq.heappush(cooldowns.setdefault(key, []), (cooldown_end, quantity))
+        busy[key] += quantity
+
+    def get_next_vehicle_ready_time(
+        self, vehicle_id: str, now: Optional[datetime] = None
+    ) -> Optional[datetime]:
+        """When the next busy vehicle of a type becomes ready, if any."""
+        self._prune_cooldowns(self.vehicle_cooldowns, self._busy_vehicles, vehicle_id, now)
+        runs = self.vehicle_cooldowns.get(vehicle_id)
+        return runs[0][0] if runs else None
+
+    def get_next_staff_ready_time(
+        self, staff_id: str, now: Optional[datetime] = None
+    ) -> Optional[datetime]:
+        """When the next busy staff member of a type becomes ready, if any."""
+        self._prune_cooldowns(self.staff_cooldowns, self._busy_staff, staff_id, now)
+        runs = self.staff_cooldowns.get(staff_id)
+        return runs[0][0] if runs else None
+
+    def get_available_vehicle_count(self, vehicle_id: str, now: Optional[datetime] = None) -> int:
         """Number of ready vehicles of a given type."""
         owned = self.get_vehicle_count(vehicle_id)
         if owned == 0:
             return 0
 
-        self._prune_cooldowns(self.vehicle_cooldowns)
-        busy = len(self.vehicle_cooldowns.get(vehicle_id, []))
+        self._prune_cooldowns(self.vehicle_cooldowns, self._busy_vehicles, vehicle_id, now)
+        busy = self._busy_vehicles.get(vehicle_id, 0)
         return max(0, owned - busy)
 
-    def get_available_staff_count(self, staff_id: str) -> int:
+    def get_available_staff_count(self, staff_id: str, now: Optional[datetime] = None) -> int:
         """Number of ready staff of a given type."""
         owned = self.get_staff_count(staff_id)
         if owned == 0:
             return 0
 
-        self._prune_cooldowns(self.staff_cooldowns)
-        busy = len(self.staff_cooldowns.get(staff_id, []))
+        self._prune_cooldowns(self.staff_cooldowns, self._busy_staff, staff_id, now)
+        busy = self._busy_staff.get(staff_id, 0)
         return max(0, owned - busy)
 
     def _ensure_assignment_buckets(self):
@@ -232,14 +474,27 @@ class PlayerProfile:
         if "staff" not in self.equipment_assignments:
             self.equipment_assignments["staff"] = {}
 
+    def _rebuild_assigned_totals(self):
+        """Recount slotted equipment from the assignment mapping."""
+        totals = Counter()
+        for target_group in (self.equipment_assignments or {}).values():
+            for equipment_counts in target_group.values():
+                totals.update(equipment_counts)
+        self._assigned_totals = totals
+
+    def _release_assigned(self, equipment_counts: Dict[str, int]):
+        """Subtract removed assignments from the slotted equipment totals."""
+        totals = self._assigned_totals
+        for equipment_id, quantity in equipment_counts.items():
+            remaining = totals[equipment_id] - quantity
+            if remaining > 0:
+                totals[equipment_id] = remaining
+            else:
+                totals.pop(equipment_id, None)
+
     def get_total_assigned_equipment(self, equipment_id: str) -> int:
         """Total number of equipment pieces currently slotted anywhere."""
-        self._ensure_assignment_buckets()
-        total = 0
-        for target_group in self.equipment_assignments.values():
-            for equipment_counts in target_group.values():
-                total += equipment_counts.get(equipment_id, 0)
-        return total
+        return self._assigned_totals.get(equipment_id, 0)
 
     def get_unassigned_equipment(self, equipment_id: str) -> int:
         """Equipment available in storage that is not slotted."""
@@ -258,12 +513,8 @@ class PlayerProfile:
 
     def _get_used_slots(self, assignments: Dict[str, int], equipment_catalog) -> int:
         """Calculate used slot capacity from assigned items."""
-        slots = 0
-        for equipment_id, quantity in assignments.items():
-            equipment = equipment_catalog.get(equipment_id)
-            if equipment:
-                slots += equipment.slot_size * quantity
-        return slots
+        sizes = _slot_sizes(equipment_catalog)
+        return sum(sizes.get(equipment_id, 0) * quantity for equipment_id, quantity in assignments.items())
 
     def get_vehicle_slot_usage(self, vehicle_id: str, vehicles, equipment_catalog) -> Dict[str, int]:
         """Return used and total slots for a vehicle type."""
@@ -281,34 +532,50 @@ class PlayerProfile:
         used_slots = self._get_used_slots(assigned, equipment_catalog)
         return {"used": used_slots, "total": total_slots}
 
-    def assign_equipment_to_vehicle(
+    def _check_assignable(
         self,
-        vehicle_id: str,
+        target: str,
+        target_id: str,
         equipment_id: str,
         quantity: int,
-        vehicles,
+        targets_catalog,
         equipment_catalog,
     ) -> bool:
-        """Assign equipment to a vehicle type if slots and inventory allow."""
+        """Check free slots on a target and unslotted stock in one pass."""
         self._ensure_assignment_buckets()
-        vehicle = vehicles.get(vehicle_id)
+        target_item = targets_catalog.get(target_id)
         equipment = equipment_catalog.get(equipment_id)
-        if not vehicle or not equipment:
+        if not target_item or not equipment:
             return False
 
-        current_assignments = self.get_equipment_for_vehicle(vehicle_id)
-        usage = self.get_vehicle_slot_usage(vehicle_id, vehicles, equipment_catalog)
-        available_slots = max(0, usage["total"] - usage["used"])
-        needed_slots = equipment.slot_size * quantity
-        if needed_slots > available_slots:
+        if self.get_unassigned_equipment(equipment_id) < quantity:
             return False
 
-        if self.get_unassigned_equipment(equipment_id) < quantity:
+        owned = self.owned_vehicles if target == "vehicles" else self.staff_roster
+        total_slots = target_item.equipment_slots * owned.get(target_id, 0)
+        used_slots = self._get_used_slots(
+            self.equipment_assignments[target].get(target_id, {}), equipment_catalog
+        )
+        return equipment.slot_size * quantity <= max(0, total_slots - used_slots)
+
+    def assign_equipment_to_vehicle(
+        self,
+        vehicle_id: str,
+        equipment_id: str,
+        quantity: int,
+        vehicles,
+        equipment_catalog,
+    ) -> bool:
+        """Assign equipment to a vehicle type if slots and inventory allow."""
+        if not self._check_assignable(
+            "vehicles", vehicle_id, equipment_id, quantity, vehicles, equipment_catalog
+        ):
             return False
 
-        updated = dict(current_assignments)
-        updated[equipment_id] = updated.get(equipment_id, 0) + quantity
-        self.equipment_assignments["vehicles"][vehicle_id] = updated
+        bucket = self.equipment_assignments["vehicles"].setdefault(vehicle_id, {})
+        bucket[equipment_id] = bucket.get(equipment_id, 0) + quantity
+        self._assigned_totals[equipment_id] += quantity
+        self.mark_dirty("equipment_assignments")
         return True
 
     def assign_equipment_to_staff(
@@ -320,25 +587,15 @@ class PlayerProfile:
         equipment_catalog,
     ) -> bool:
         """Assign equipment to a staff type if slots and inventory allow."""
-        self._ensure_assignment_buckets()
-        staff = staff_catalog.get(staff_id)
-        equipment = equipment_catalog.get(equipment_id)
-        if not staff or not equipment:
-            return False
-
-        current_assignments = self.get_equipment_for_staff(staff_id)
-        usage = self.get_staff_slot_usage(staff_id, staff_catalog, equipment_catalog)
-        available_slots = max(0, usage["total"] - usage["used"])
-        needed_slots = equipment.slot_size * quantity
-        if needed_slots > available_slots:
+        if not self._check_assignable(
+            "staff", staff_id, equipment_id, quantity, staff_catalog, equipment_catalog
+        ):
             return False
 
-        if self.get_unassigned_equipment(equipment_id) < quantity:
-            return False
-
-        updated = dict(current_assignments)
-        updated[equipment_id] = updated.get(equipment_id, 0) + quantity
-        self.equipment_assignments["staff"][staff_id] = updated
+        bucket = self.equipment_assignments["staff"].setdefault(staff_id, {})
+        bucket[equipment_id] = bucket.get(equipment_id, 0) + quantity
+        self._assigned_totals[equipment_id] += quantity
+        self.mark_dirty("equipment_assignments")
         return True
 
     def unassign_equipment(
@@ -358,53 +615,91 @@ class PlayerProfile:
             target_map.pop(equipment_id, None)
         else:
             target_map[equipment_id] = current - quantity
+        self._release_assigned({equipment_id: min(quantity, current)})
 
         if not target_map:
             self.equipment_assignments[target].pop(target_id, None)
         else:
             self.equipment_assignments[target][target_id] = target_map
 
+        self.mark_dirty("equipment_assignments")
         return True
 
-    def is_vehicle_available(self, vehicle_id: str) -> bool:
+    def is_vehicle_available(self, vehicle_id: str, now: Optional[datetime] = None) -> bool:
         """Check if at least one vehicle of this type is available (not on cooldown)."""
-        return self.get_available_vehicle_count(vehicle_id) > 0
+        return self.get_available_vehicle_count(vehicle_id, now) > 0
 
-    def is_staff_available(self, staff_id: str) -> bool:
+    def is_staff_available(self, staff_id: str, now: Optional[datetime] = None) -> bool:
         """Check if at least one staff member of this type is available."""
-        return self.get_available_staff_count(staff_id) > 0
+        return self.get_available_staff_count(staff_id, now) > 0
 
-    def allocate_vehicles(self, vehicle_counts: Counter, cooldown_end: datetime):
+    def allocate_vehicles(
+        self, vehicle_counts: Mapping[str, int], cooldown_end: datetime, now: Optional[datetime] = None
+    ):
         """Mark the given vehicles as busy until the provided time."""
+        now = now or datetime.utcnow()
         for vehicle_id, quantity in vehicle_counts.items():
             if quantity <= 0:
                 continue
 
-            ready_slots = self.get_available_vehicle_count(vehicle_id)
+            ready_slots = self.get_available_vehicle_count(vehicle_id, now)
             if quantity > ready_slots:
                 quantity = ready_slots
 
-            entries = self.vehicle_cooldowns.setdefault(vehicle_id, [])
-            entries.extend([cooldown_end] * quantity)
+            if quantity <= 0:
+                continue
 
-    def allocate_staff(self, staff_counts: Counter, cooldown_end: datetime):
+            self._allocate(
+                self.vehicle_cooldowns, self._busy_vehicles, vehicle_id, quantity, cooldown_end
+            )
+            self.mark_dirty("vehicle_cooldowns")
+
+    def allocate_staff(
+        self, staff_counts: Mapping[str, int], cooldown_end: datetime, now: Optional[datetime] = None
+    ):
         """Mark the given staff members as busy until the provided time."""
+        now = now or datetime.utcnow()
         for staff_id, quantity in staff_counts.items():
             if quantity <= 0:
                 continue
 
-            ready_slots = self.get_available_staff_count(staff_id)
+            ready_slots = self.get_available_staff_count(staff_id, now)
             if quantity > ready_slots:
                 quantity = ready_slots
 
-            entries = self.staff_cooldowns.setdefault(staff_id, [])
-            entries.extend([cooldown_end] * quantity)
+            if quantity <= 0:
+                continue
+
+            self._allocate(
+                self.staff_cooldowns, self._busy_staff, staff_id, quantity, cooldown_end
+            )
+            self.mark_dirty("staff_cooldowns")
 
     def add_active_mission(self, mission: ActiveMission):
         """Add a mission to the active missions list without discarding pending entries."""
-        self.active_missions.append(mission)
+        bisect.insort(self.active_missions, mission, key=_MISSION_END)
+        self.mark_dirty("active_missions")
+
+    def take_ended_missions(self, now_ts: Optional[float] = None) -> List[ActiveMission]:
+        """Remove and return the missions that ended by now_ts (a Unix timestamp)."""
+        missions = self.active_missions
+        if now_ts is None:
+            now_ts = time.time()
+        # Sorted by end time: nothing has ended unless the earliest mission has
+        if not missions or missions[0].ends_at_ts > now_ts:
+            return []
+        ended = bisect.bisect_right(missions, now_ts, key=_MISSION_END)
+        taken = missions[:ended]
+        del missions[:ended]
+        self.mark_dirty("active_missions")
+        return taken
 
     def prune_expired_missions(self, reference_time: Optional[datetime] = None):
         """Remove missions that have already ended."""
-        reference_time = reference_time or datetime.utcnow()
-        self.active_missions = [mission for mission in self.active_missions if mission.ends_at > reference_time]
+        if reference_time is None:
+            reference_ts = time.time()
+        else:
+            reference_ts = (reference_time - _EPOCH).total_seconds()
+        expired = bisect.bisect_right(self.active_missions, reference_ts, key=_MISSION_END)
+        if expired:
+            self.active_missions = self.active_missions[expired:]
@@ -6,7 +6,7 @@ Author: BrandjuhNL
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Staff:
     """Represents a staff type that can be hired."""
     
@@ -3,11 +3,11 @@ Upgrade model
 Author: BrandjuhNL
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Upgrade:
     """Represents a purchasable station upgrade."""
     
@@ -19,6 +19,12 @@ class Upgrade:
     effect_value: float  # Value of the effect
     min_station_level: int = 1
     required_upgrade: Optional[str] = None  # ID of upgrade that must be owned first
+
+    # Rendered once in __post_init__
+    _effect_description: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_effect_description", self._build_effect_description())
     
     def get_display_name(self) -> str:
         """Get formatted display name."""
@@ -26,6 +32,10 @@ class Upgrade:
     
     def get_effect_description(self) -> str:
         """Get human-readable effect description."""
+        return self._effect_description
+
+    def _build_effect_description(self) -> str:
+        """Render the effect description from effect_type and effect_value."""
         if self.effect_type == "automation":
             return "Unlocks automation features"
         elif self.effect_type == "cost_reduction":
@@ -6,7 +6,7 @@ Author: BrandjuhNL
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Vehicle:
     """Represents a vehicle type that can be purchased."""
 
@@ -11,7 +11,7 @@ from redbot.core.bot import Red
 
 from .db import Repository, MigrationManager
 from .services import ContentLoader, GameEngine, TickEngine
-from .ui import DashboardView, InteractionController
+from .ui import DashboardView, InteractionController, get_attached_view
 
 log = logging.getLogger("red.policechief")
 
@@ -46,6 +46,7 @@ class PoliceChief(commands.Cog):
         
         # Initialize repository
         self.repository = Repository(self.db_path)
+        await self.repository.connect()
         
         # Initialize content loader
         self.content_loader = ContentLoader(self.data_path, self.schema_path)
@@ -68,10 +69,12 @@ class PoliceChief(commands.Cog):
         
         log.info("PoliceChief cog initialized successfully")
     
-    def cog_unload(self):
+    async def cog_unload(self):
         """Cleanup when cog is unloaded."""
         if self.tick_engine:
             self.tick_engine.stop()
+        if self.repository:
+            await self.repository.close()
         log.info("PoliceChief cog unloaded")
     
     @commands.command(name="pc")
@@ -84,14 +87,23 @@ class PoliceChief(commands.Cog):
         # Get or create profile
         profile = await self.repository.get_or_create_profile(ctx.author.id)
         
-        # Process catch-up ticks
+        # Process catch-up ticks (updates and saves this profile in place)
         catchup_messages = await self.tick_engine.process_catchup(profile)
         
-        # Reload profile after catch-up
-        profile = await self.repository.get_profile(ctx.author.id)
-        
-        # Create dashboard view
-        view = DashboardView(self, profile, ctx.author)
+        # Address the existing dashboard without fetching it; a deleted message
+        # surfaces as NotFound from the edit below
+        existing_message = None
+        if profile.dashboard_message_id and profile.dashboard_channel_id:
+            channel = self.bot.get_channel(profile.dashboard_channel_id)
+            if channel and channel.id == ctx.channel.id:
+                existing_message = channel.get_partial_message(profile.dashboard_message_id)
+
+        # Reuse the live dashboard view on that message when there is one
+        current_view = get_attached_view(existing_message.id) if existing_message else None
+        if isinstance(current_view, DashboardView) and current_view.reset(profile, ctx.author):
+            view = current_view
+        else:
+            view = DashboardView(self, profile, ctx.author)
         embed = await view.build_embed()
         
         # Add catch-up messages if any
@@ -101,41 +113,44 @@ class PoliceChief(commands.Cog):
                 value="\n".join(catchup_messages[:3]),
                 inline=False
             )
-        
-        # Close any existing dashboard before opening a new one
-        existing_message = None
-        if profile.dashboard_message_id and profile.dashboard_channel_id:
-            channel = self.bot.get_channel(profile.dashboard_channel_id)
-            if channel and channel.id == ctx.channel.id:
-                try:
-                    message = await channel.fetch_message(profile.dashboard_message_id)
-                    if message and message.components:
-                        existing_message = message
-                    else:
-                        profile.dashboard_message_id = None
-                        profile.dashboard_channel_id = None
-                        await self.repository.save_profile(profile)
-                except discord.NotFound:
-                    profile.dashboard_message_id = None
-                    profile.dashboard_channel_id = None
-                    await self.repository.save_profile(profile)
-                except Exception as e:
-                    log.warning(f"Failed to update existing dashboard message: {e}")
+
+        fingerprint = hash(repr(embed.to_dict()))
 
         if existing_message:
-            await existing_message.edit(embed=embed, view=view)
-            view.attach_message(existing_message)
-            await ctx.send(
-                f"📊 Dashboard refreshed. [Open your dashboard]({existing_message.jump_url})",
-                suppress_embeds=True
-            )
-            return
+            refreshed = False
+            try:
+                # Skip the edit when the live dashboard already shows this content
+                if view is not current_view or view.embed_fingerprint != fingerprint:
+                    message = await existing_message.edit(embed=embed, view=view)
+                    view.attach_message(message)
+                else:
+                    # The view can outlive a deleted message; confirm it still exists
+                    await existing_message.fetch()
+                view.embed_fingerprint = fingerprint
+                refreshed = True
+            except discord.NotFound:
+                # Stale reference; overwritten when the new dashboard is sent
+                pass
+            except Exception as e:
+                log.warning(f"Failed to update existing dashboard message: {e}")
+
+            if refreshed:
+                await ctx.send(
+                    f"📊 Dashboard refreshed. [Open your dashboard]({existing_message.jump_url})",
+                    suppress_embeds=True
+                )
+                return
+            if view is current_view:
+                # Never attach one view to two messages
+                view = DashboardView(self, profile, ctx.author)
 
         # Send new message
         message = await ctx.send(embed=embed, view=view)
         view.attach_message(message)
+        view.embed_fingerprint = fingerprint
 
-        # Save message ID for future updates
+        # Save message ID for future updates; this also replaces a stale
+        # dashboard reference, so a single write covers both
         profile.dashboard_message_id = message.id
         profile.dashboard_channel_id = ctx.channel.id
         await self.repository.save_profile(profile)
@@ -178,8 +193,7 @@ class PoliceChief(commands.Cog):
         from redbot.core import bank
         
         try:
-            await bank.deposit_credits(user, amount)
-            new_balance = await bank.get_balance(user)
+            new_balance = await bank.deposit_credits(user, amount)
             await ctx.send(
                 f"✅ Added {amount:,} credits to {user.display_name}\n"
                 f"New balance: {new_balance:,} credits"
@@ -253,8 +267,7 @@ class PoliceChief(commands.Cog):
                     return
                 old_value = profile.current_district
                 profile.current_district = district_id
-                if district_id not in profile.unlocked_districts:
-                    profile.unlocked_districts.append(district_id)
+                profile.unlock_district(district_id)
                 change_text = f"Current district: {old_value} → {district_id}"
             else:
                 await ctx.send(
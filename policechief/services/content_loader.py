@@ -3,20 +3,133 @@ Content pack loader with JSON schema validation
 Author: BrandjuhNL
 """
 
+import asyncio
+import bisect
 import json
 import logging
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Type
+from typing import Callable, Collection, Dict, FrozenSet, Iterable, List, Optional, Tuple, Type
 
 import jsonschema
 
-from ..models import Equipment, Mission, Vehicle, District, Staff, Upgrade, Policy
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover - optional speedup
+    fastjsonschema = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency for huge packs
+    ijson = None
+
+from ..models import Equipment, Mission, Vehicle, District, Staff, Upgrade, Policy, intern_id
 
 log = logging.getLogger("red.policechief.content_loader")
 
 
+if orjson is not None:
+    def _read_json(path: Path):
+        """Parse a JSON file."""
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+else:  # pragma: no cover - exercised only without orjson installed
+    def _read_json(path: Path):
+        """Parse a JSON file."""
+        with open(path, "r") as f:
+            return json.load(f)
+
+
+# Packs at least this large are streamed entry by entry when ijson is installed
+_STREAM_PACK_BYTES = 1024 * 1024
+
+
+def _stream_entries(pack_file: Path, top_key: str, item_schema: Optional[Callable[[dict], object]]):
+    """Yield the entries under top_key one at a time, validating each."""
+    with open(pack_file, "rb") as f:
+        for entry in ijson.items(f, f"{top_key}.item", use_float=True):
+            if item_schema:
+                item_schema(entry)
+            yield entry
+
+
+# Enum-like pack fields (single IDs or lists of IDs) whose strings repeat
+# across many entries; interned so every model shares one copy
+_INTERNED_FIELDS = frozenset(
+    (
+        "id",
+        "district",
+        "vehicle_type",
+        "staff_type",
+        "effect_type",
+        "target",
+        "required_upgrade",
+        "required_vehicle_types",
+        "required_staff_types",
+        "allowed_vehicle_types",
+        "allowed_staff_types",
+    )
+)
+
+
+def _intern_entry(entry: dict) -> None:
+    """Intern the enum-like string fields of a pack entry in place."""
+    for key in _INTERNED_FIELDS.intersection(entry):
+        value = entry[key]
+        if isinstance(value, str):
+            entry[key] = intern_id(value)
+        elif isinstance(value, list):
+            entry[key] = [intern_id(item) if isinstance(item, str) else item for item in value]
+
+
+# Sorted distinct min_station_level values, and for each one the catalog
+# entries unlocked at that level (in catalog order)
+_LevelIndex = Tuple[List[int], List[list]]
+_EMPTY_LEVEL_INDEX: _LevelIndex = ([], [])
+
+
+def _index_by_level(items: Iterable) -> _LevelIndex:
+    """Precompute the entries available at each distinct station level."""
+    items = list(items)
+    levels = sorted({item.min_station_level for item in items})
+    buckets = [[item for item in items if item.min_station_level <= level] for level in levels]
+    return levels, buckets
+
+
+def _select_by_level(index: _LevelIndex, level: int) -> list:
+    """Entries with min_station_level <= level, in catalog order."""
+    levels, buckets = index
+    position = bisect.bisect_right(levels, level)
+    return list(buckets[position - 1]) if position else []
+
+
+# Raised by a compiled schema validator when a pack does not match
+if fastjsonschema is not None:
+    _SCHEMA_ERRORS = (jsonschema.ValidationError, fastjsonschema.JsonSchemaException)
+else:  # pragma: no cover - exercised only without fastjsonschema installed
+    _SCHEMA_ERRORS = (jsonschema.ValidationError,)
+
+
 class ContentLoader:
     """Loads and validates content packs from JSON files."""
+
+    # (catalog attribute, schema file, model). The attribute name doubles as
+    # the pack file prefix (missions_*.json) and the top-level JSON key.
+    _PACK_SPECS = (
+        ("missions", "mission.schema.json", Mission),
+        ("vehicles", "vehicle.schema.json", Vehicle),
+        ("districts", "district.schema.json", District),
+        ("staff", "staff.schema.json", Staff),
+        ("upgrades", "upgrade.schema.json", Upgrade),
+        ("policies", "policy.schema.json", Policy),
+        ("equipment", "equipment.schema.json", Equipment),
+    )
     
     def __init__(self, data_dir: Path, schema_dir: Path):
         self.data_dir = data_dir
@@ -29,18 +142,55 @@ class ContentLoader:
         self.upgrades: Dict[str, Upgrade] = {}
         self.policies: Dict[str, Policy] = {}
         self.equipment: Dict[str, Equipment] = {}
+        # Staff types that do not occupy a vehicle seat
+        self.unseated_staff_ids: FrozenSet[str] = frozenset()
+        # Vehicle and staff IDs grouped by their vehicle_type / staff_type
+        self.vehicles_by_type: Dict[str, List[str]] = {}
+        self.staff_by_type: Dict[str, List[str]] = {}
+        # Upgrade IDs grouped by effect_type, sorted within each group
+        self.upgrades_by_effect: Dict[str, List[str]] = {}
+        # Level-sliced lookups rebuilt after every load
+        self._missions_by_district: Dict[str, _LevelIndex] = {}
+        self._vehicles_by_level: _LevelIndex = _EMPTY_LEVEL_INDEX
+        self._staff_by_level: _LevelIndex = _EMPTY_LEVEL_INDEX
+        self._districts_by_level: _LevelIndex = _EMPTY_LEVEL_INDEX
+        self._upgrades_by_level: _LevelIndex = _EMPTY_LEVEL_INDEX
+        self._equipment_by_level: _LevelIndex = _EMPTY_LEVEL_INDEX
+        # Per-loader memo of get_available_upgrades, cleared on every load
+        self._available_upgrades_cached = lru_cache(maxsize=1024)(self._find_available_upgrades)
+        # Pack files found by the current load, keyed by category prefix
+        self._pack_files: Dict[str, List[Path]] = {}
+        # Compiled schema validators keyed by (schema filename, items_of)
+        self._validators: Dict[Tuple[str, Optional[str]], Optional[Callable[[dict], object]]] = {}
     
     async def load_all(self):
         """Load all content packs."""
         log.info("Loading content packs...")
 
-        await self._load_missions()
-        await self._load_vehicles()
-        await self._load_districts()
-        await self._load_staff()
-        await self._load_upgrades()
-        await self._load_policies()
-        await self._load_equipment()
+        self._pack_files = self._discover_packs()
+
+        # Each pack type fills its own fresh catalog, so they can load side by
+        # side while the live catalogs keep serving other handlers
+        catalogs: Dict[str, Dict[str, object]] = {attr: {} for attr, _, _ in self._PACK_SPECS}
+        await asyncio.gather(
+            *(
+                self._load_pack(
+                    category=attr,
+                    schema=self._load_schema(schema_file),
+                    item_schema=self._load_schema(schema_file, items_of=attr) if ijson else None,
+                    top_key=attr,
+                    model_cls=model_cls,
+                    target=catalogs[attr],
+                )
+                for attr, schema_file, model_cls in self._PACK_SPECS
+            )
+        )
+
+        # Swap everything in without yielding, so no handler sees a mix of
+        # old and new content
+        for attr, catalog in catalogs.items():
+            setattr(self, attr, catalog)
+        self._build_indices()
 
         log.info(
             f"Loaded content: {len(self.missions)} missions, "
@@ -49,193 +199,219 @@ class ContentLoader:
             f"{len(self.policies)} policies, {len(self.equipment)} equipment items"
         )
     
-    async def _load_missions(self):
-        """Load mission packs."""
-        self.missions = {}
-        schema = self._load_schema("mission.schema.json")
-        await self._load_pack(
-            pattern="missions_*.json",
-            schema=schema,
-            top_key="missions",
-            model_cls=Mission,
-            target=self.missions,
-        )
-    
-    async def _load_vehicles(self):
-        """Load vehicle packs."""
-        self.vehicles = {}
-        schema = self._load_schema("vehicle.schema.json")
-        await self._load_pack(
-            pattern="vehicles_*.json",
-            schema=schema,
-            top_key="vehicles",
-            model_cls=Vehicle,
-            target=self.vehicles,
-        )
-    
-    async def _load_districts(self):
-        """Load district packs."""
-        self.districts = {}
-        schema = self._load_schema("district.schema.json")
-        await self._load_pack(
-            pattern="districts_*.json",
-            schema=schema,
-            top_key="districts",
-            model_cls=District,
-            target=self.districts,
-        )
-    
-    async def _load_staff(self):
-        """Load staff packs."""
-        self.staff = {}
-        schema = self._load_schema("staff.schema.json")
-        await self._load_pack(
-            pattern="staff_*.json",
-            schema=schema,
-            top_key="staff",
-            model_cls=Staff,
-            target=self.staff,
-        )
-    
-    async def _load_upgrades(self):
-        """Load upgrade packs."""
-        self.upgrades = {}
-        schema = self._load_schema("upgrade.schema.json")
-        await self._load_pack(
-            pattern="upgrades_*.json",
-            schema=schema,
-            top_key="upgrades",
-            model_cls=Upgrade,
-            target=self.upgrades,
-        )
-    
-    async def _load_policies(self):
-        """Load policy packs."""
-        self.policies = {}
-        schema = self._load_schema("policy.schema.json")
-        await self._load_pack(
-            pattern="policies_*.json",
-            schema=schema,
-            top_key="policies",
-            model_cls=Policy,
-            target=self.policies,
-        )
+    def _discover_packs(self) -> Dict[str, List[Path]]:
+        """Group the data directory's pack files by category in one scan.
 
-    async def _load_equipment(self):
-        """Load equipment packs."""
-        self.equipment = {}
-        schema = self._load_schema("equipment.schema.json")
-        await self._load_pack(
-            pattern="equipment_*.json",
-            schema=schema,
-            top_key="equipment",
-            model_cls=Equipment,
-            target=self.equipment,
+        Pack files are named ``<category>_<name>.json``.
+        """
+        packs: Dict[str, List[Path]] = {}
+        try:
+            with os.scandir(self.data_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not name.endswith(".json") or "_" not in name or not entry.is_file():
+                        continue
+                    category = name.split("_", 1)[0]
+                    packs.setdefault(category, []).append(Path(entry.path))
+        except OSError as exc:
+            log.error(f"Failed to scan content directory {self.data_dir}: {exc}")
+        return packs
+
+    def _build_indices(self):
+        """Index the loaded catalogs by district, station level, type, effect and seating."""
+        missions_by_district: Dict[str, List[Mission]] = {}
+        for mission in self.missions.values():
+            missions_by_district.setdefault(mission.district, []).append(mission)
+        self._missions_by_district = {
+            district_id: _index_by_level(missions)
+            for district_id, missions in missions_by_district.items()
+        }
+        self._vehicles_by_level = _index_by_level(self.vehicles.values())
+        self._staff_by_level = _index_by_level(self.staff.values())
+        self._districts_by_level = _index_by_level(self.districts.values())
+        self._upgrades_by_level = _index_by_level(self.upgrades.values())
+        self._equipment_by_level = _index_by_level(self.equipment.values())
+        vehicles_by_type: Dict[str, List[str]] = {}
+        for vehicle_id, vehicle in self.vehicles.items():
+            vehicles_by_type.setdefault(vehicle.vehicle_type, []).append(vehicle_id)
+        self.vehicles_by_type = vehicles_by_type
+        staff_by_type: Dict[str, List[str]] = {}
+        for staff_id, staff in self.staff.items():
+            staff_by_type.setdefault(staff.staff_type, []).append(staff_id)
+        self.staff_by_type = staff_by_type
+        upgrades_by_effect: Dict[str, List[str]] = {}
+        for upgrade_id in sorted(self.upgrades):
+            upgrades_by_effect.setdefault(self.upgrades[upgrade_id].effect_type, []).append(upgrade_id)
+        self.upgrades_by_effect = upgrades_by_effect
+        self.unseated_staff_ids = frozenset(
+            staff_id for staff_id, staff in self.staff.items() if not staff.requires_vehicle
         )
+        self._available_upgrades_cached.cache_clear()
+
+    def _load_schema(
+        self, filename: str, items_of: Optional[str] = None
+    ) -> Optional[Callable[[dict], object]]:
+        """Load a JSON schema file and compile it into a validator.
+
+        With items_of, only the schema for one entry of that top-level array is
+        compiled (used when streaming large packs). Validators are compiled
+        once and reused for every later reload. Returns None when the schema
+        is missing or empty.
+        """
+        cache_key = (filename, items_of)
+        if cache_key in self._validators:
+            return self._validators[cache_key]
 
-    def _load_schema(self, filename: str) -> dict:
-        """Load a JSON schema file."""
         path = self.schema_dir / filename
         try:
-            with open(path, "r") as f:
-                return json.load(f)
+            schema = _read_json(path)
+            if items_of and schema:
+                schema = schema.get("properties", {}).get(items_of, {}).get("items")
+            validator = self._compile_schema(filename, schema) if schema else None
         except Exception as exc:
             log.error(f"Failed to load schema {filename}: {exc}")
-            return {}
+            return None
+
+        self._validators[cache_key] = validator
+        return validator
+
+    @staticmethod
+    def _compile_schema(filename: str, schema: dict) -> Callable[[dict], object]:
+        """Build a reusable validator, preferring fastjsonschema when installed."""
+        if fastjsonschema is not None:
+            try:
+                return fastjsonschema.compile(schema)
+            except Exception as exc:
+                log.warning(f"Could not compile schema {filename} with fastjsonschema: {exc}")
+
+        validator_cls = jsonschema.validators.validator_for(schema)
+        validator_cls.check_schema(schema)
+        return validator_cls(schema).validate
+
+    @staticmethod
+    def _read_pack(
+        pack_file: Path,
+        schema: Optional[Callable[[dict], object]],
+        top_key: str,
+        model_cls: Type,
+        item_schema: Optional[Callable[[dict], object]] = None,
+    ) -> list:
+        """Read, validate and build the model instances of one pack file.
+
+        Large packs are streamed with ijson, when installed, and validated per
+        entry instead of being materialized as one document.
+        """
+        if ijson is not None and pack_file.stat().st_size >= _STREAM_PACK_BYTES:
+            entries = _stream_entries(pack_file, top_key, item_schema)
+        else:
+            data = _read_json(pack_file)
+            if schema:
+                schema(data)
+            entries = data.get(top_key, [])
+
+        objects = []
+        for entry in entries:
+            try:
+                _intern_entry(entry)
+                objects.append(model_cls(**entry))
+            except Exception as entry_exc:
+                log.error(
+                    f"Failed to load {model_cls.__name__} from {pack_file.name}: {entry_exc}"
+                )
+        return objects
 
     async def _load_pack(
         self,
         *,
-        pattern: str,
-        schema: dict,
+        category: str,
+        schema: Optional[Callable[[dict], object]],
         top_key: str,
         model_cls: Type,
         target: Dict[str, object],
+        item_schema: Optional[Callable[[dict], object]] = None,
     ):
         """
         Shared helper for loading and validating a pack file.
 
         Args:
-            pattern: Glob pattern inside the data directory.
-            schema: JSON schema dictionary for validation.
+            category: Pack file prefix, e.g. "missions" for missions_*.json.
+            schema: Compiled schema validator, or None to skip validation.
             top_key: Top-level key in the JSON data.
             model_cls: Dataclass to instantiate per entry.
             target: Dictionary to populate with ID -> model instances.
+            item_schema: Validator for a single entry, used when streaming.
         """
-        for pack_file in self.data_dir.glob(pattern):
-            try:
-                with open(pack_file, "r") as f:
-                    data = json.load(f)
+        # Each file is parsed, validated and turned into models in one pass on
+        # a worker thread; only the catalog writes happen on the event loop
+        pack_files = self._pack_files.get(category, [])
+        results = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    self._read_pack, pack_file, schema, top_key, model_cls, item_schema
+                )
+                for pack_file in pack_files
+            ),
+            return_exceptions=True,
+        )
 
-                # Validate content pack against schema when available
-                if schema:
-                    jsonschema.validate(instance=data, schema=schema)
+        for pack_file, objects in zip(pack_files, results):
+            try:
+                if isinstance(objects, Exception):
+                    raise objects
 
-                entries = data.get(top_key, [])
-                loaded_count = 0
+                for obj in objects:
+                    target[obj.id] = obj
 
-                for entry in entries:
-                    try:
-                        obj = model_cls(**entry)
-                        target[obj.id] = obj
-                        loaded_count += 1
-                    except Exception as entry_exc:
-                        log.error(
-                            f"Failed to load {model_cls.__name__} from {pack_file.name}: {entry_exc}"
-                        )
-
-                log.info(f"Loaded {pack_file.name}: {loaded_count} {top_key}")
-            except jsonschema.ValidationError as val_err:
+                log.info(f"Loaded {pack_file.name}: {len(objects)} {top_key}")
+            except _SCHEMA_ERRORS as val_err:
+                path = getattr(val_err, "absolute_path", None)
+                if path is None:
+                    path = getattr(val_err, "path", [])
                 log.error(
-                    f"Validation failed for {pack_file.name}: {val_err.message} at {list(val_err.absolute_path)}"
+                    f"Validation failed for {pack_file.name}: "
+                    f"{getattr(val_err, 'message', val_err)} at {list(path)}"
                 )
             except Exception as e:
                 log.error(f"Error loading {pack_file.name}: {e}")
     
     def get_missions_for_district(self, district_id: str, min_level: int) -> List[Mission]:
         """Get all missions available in a district for a given station level."""
-        return [
-            m for m in self.missions.values()
-            if m.district == district_id and m.min_station_level <= min_level
-        ]
+        index = self._missions_by_district.get(district_id, _EMPTY_LEVEL_INDEX)
+        return _select_by_level(index, min_level)
     
     def get_available_vehicles(self, min_level: int) -> List[Vehicle]:
         """Get all vehicles available for purchase at given station level."""
-        return [
-            v for v in self.vehicles.values()
-            if v.min_station_level <= min_level
-        ]
+        return _select_by_level(self._vehicles_by_level, min_level)
     
     def get_available_staff(self, min_level: int) -> List[Staff]:
         """Get all staff types available for hire at given station level."""
-        return [
-            s for s in self.staff.values()
-            if s.min_station_level <= min_level
-        ]
+        return _select_by_level(self._staff_by_level, min_level)
     
     def get_available_districts(self, min_level: int) -> List[District]:
         """Get all districts available to unlock at given station level."""
-        return [
-            d for d in self.districts.values()
-            if d.min_station_level <= min_level
-        ]
+        return _select_by_level(self._districts_by_level, min_level)
     
-    def get_available_upgrades(self, min_level: int, owned_upgrades: List[str]) -> List[Upgrade]:
-        """Get all upgrades available for purchase."""
-        available = []
-        for upgrade in self.upgrades.values():
-            if upgrade.min_station_level > min_level:
-                continue
-            if upgrade.id in owned_upgrades:
-                continue
-            if upgrade.required_upgrade and upgrade.required_upgrade not in owned_upgrades:
-                continue
-            available.append(upgrade)
-        return available
+    def get_available_upgrades(self, min_level: int, owned_upgrades: Collection[str]) -> List[Upgrade]:
+        """Get all upgrades available for purchase.
+
+        owned_upgrades is frozen into a set once (a frozenset is used as is),
+        so every ownership check below is a hash lookup.
+        """
+        if not isinstance(owned_upgrades, frozenset):
+            owned_upgrades = frozenset(owned_upgrades)
+        return list(self._available_upgrades_cached(min_level, owned_upgrades))
+
+    def _find_available_upgrades(
+        self, min_level: int, owned_upgrades: FrozenSet[str]
+    ) -> Tuple[Upgrade, ...]:
+        """Upgrades unlocked at min_level that are not owned and have their prerequisite."""
+        return tuple(
+            upgrade
+            for upgrade in _select_by_level(self._upgrades_by_level, min_level)
+            if upgrade.id not in owned_upgrades
+            and (not upgrade.required_upgrade or upgrade.required_upgrade in owned_upgrades)
+        )
 
     def get_available_equipment(self, min_level: int) -> List[Equipment]:
         """Get all equipment available to purchase for a station level."""
-        return [
-            e for e in self.equipment.values()
-            if e.min_station_level <= min_level
-        ]
+        return _select_by_level(self._equipment_by_level, min_level)
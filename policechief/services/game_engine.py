@@ -5,9 +5,11 @@ Author: BrandjuhNL
 
 import logging
 import random
-from collections import Counter
-from datetime import datetime, timedelta
-from typing import Dict, Optional, Tuple
+import time
+from collections import Counter, OrderedDict
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from .tick_engine import TickEngine
 from redbot.core import bank
 from redbot.core.bot import Red
@@ -17,8 +19,6 @@ from ..models import (
     ActiveMission,
     PlayerProfile,
     Mission,
-    Vehicle,
-    Staff,
     District,
     DISPATCH_BASE_TABLES,
     DISPATCHER_STAFF_ID,
@@ -27,6 +27,17 @@ from ..models import (
 log = logging.getLogger("red.policechief.game_engine")
 
 
+@lru_cache(maxsize=64)
+def _minutes(minutes: int) -> timedelta:
+    """Shared timedelta for a cooldown or duration; content uses few distinct values."""
+    return timedelta(minutes=minutes)
+
+
+def _clamp_percent(value: int) -> int:
+    """Clamp a reputation or heat value into 0-100."""
+    return 0 if value < 0 else 100 if value > 100 else value
+
+
 class GameEngine:
     """Core game logic and calculations."""
     
@@ -35,67 +46,72 @@ class GameEngine:
     PROFIT_MARGIN = 0.1  # Minimum profit margin versus dispatch cost on success
     PROFIT_PER_LEVEL = 0.015  # 1.5% extra reward per station level above 1
     FAILURE_CHANCE_PENALTY = 3  # Flat reduction to final success chance to make failures slightly more likely
+    BANK_USER_CACHE_SIZE = 1024  # Users fetched from the API that are kept for bank operations
 
     def __init__(self, bot: Red, content_loader):
         self.bot = bot
         self.content = content_loader
+        # Users that had to be fetched because they were not in the bot's cache
+        self._bank_users: "OrderedDict[int, discord.abc.User]" = OrderedDict()
     
-    def can_dispatch_mission(self, profile: PlayerProfile, mission: Mission) -> Tuple[bool, str]:
+    def can_dispatch_mission(
+        self, profile: PlayerProfile, mission: Mission, now: Optional[datetime] = None
+    ) -> Tuple[bool, str]:
         """
         Check if a mission can be dispatched.
         Returns (can_dispatch, reason_if_not)
         """
+        # Check station level first; it needs no cooldown bookkeeping
+        if profile.station_level < mission.min_station_level:
+            return False, f"Requires station level {mission.min_station_level}"
+
+        now = now or datetime.utcnow()
+
         # Ensure a dispatcher is available to operate the center
-        if not self.has_active_dispatcher(profile):
+        if not self.has_active_dispatcher(profile, now):
             return False, "Dispatch Center requires a dispatcher on duty"
 
-        # Check station level
-        if profile.station_level < mission.min_station_level:
-            return False, f"Requires station level {mission.min_station_level}"
-        
         # Check vehicle requirements (respecting quantity needed per type)
-        vehicle_requirements = Counter(mission.required_vehicle_types)
-        for vehicle_type, quantity_needed in vehicle_requirements.items():
+        for vehicle_type, quantity_needed in mission.required_vehicle_counts:
             available_quantity = 0
-            for vehicle_id, vehicle in self.content.vehicles.items():
-                if vehicle.vehicle_type == vehicle_type:
-                    available_quantity += profile.get_available_vehicle_count(vehicle_id)
+            for vehicle_id in self.content.vehicles_by_type.get(vehicle_type, ()):
+                available_quantity += profile.get_available_vehicle_count(vehicle_id, now)
+                if available_quantity >= quantity_needed:
+                    break
 
             if available_quantity < quantity_needed:
                 return False, f"Need {quantity_needed} available {vehicle_type} vehicle(s)"
 
         # Check staff requirements (respecting quantity needed per type)
-        staff_requirements = Counter(mission.required_staff_types)
-        for staff_type, quantity_needed in staff_requirements.items():
+        for staff_type, quantity_needed in mission.required_staff_counts:
             available_quantity = 0
-            for staff_id, staff in self.content.staff.items():
-                if staff.staff_type == staff_type:
-                    available_quantity += profile.get_available_staff_count(staff_id)
+            for staff_id in self.content.staff_by_type.get(staff_type, ()):
+                available_quantity += profile.get_available_staff_count(staff_id, now)
+                if available_quantity >= quantity_needed:
+                    break
 
             if available_quantity < quantity_needed:
                 return False, f"Need {quantity_needed} available {staff_type} staff"
 
         return True, ""
 
-    def has_active_dispatcher(self, profile: PlayerProfile) -> bool:
+    def has_active_dispatcher(
+        self, profile: PlayerProfile, now: Optional[datetime] = None
+    ) -> bool:
         """Return True if the dispatch center has a dispatcher assigned and available."""
-        return self.get_available_dispatcher_count(profile) > 0
+        return self.get_available_dispatcher_count(profile, now) > 0
 
     def _plan_allocation(
         self,
-        requirements: Counter,
-        catalog: Dict[str, Vehicle] | Dict[str, Staff],
-        type_attribute: str,
+        requirements: Tuple[Tuple[str, int], ...],
+        ids_by_type: Dict[str, List[str]],
         availability_fn,
     ) -> Counter:
         """Plan concrete unit allocations for a mission requirement."""
         plan: Counter = Counter()
-        for required_type, quantity_needed in requirements.items():
+        for required_type, quantity_needed in requirements:
             remaining = quantity_needed
-            for entity_id, entity in catalog.items():
-                if getattr(entity, type_attribute) != required_type:
-                    continue
-
+            for entity_id in ids_by_type.get(required_type, ()):
                 available = availability_fn(entity_id)
                 if available <= 0:
                     continue
@@ -114,29 +130,42 @@ class GameEngine:
         return plan
 
     def plan_resources_for_mission(
-        self, profile: PlayerProfile, mission: Mission
+        self, profile: PlayerProfile, mission: Mission, now: Optional[datetime] = None
     ) -> tuple[Counter, Counter]:
         """Determine which concrete vehicles and staff will be used for a mission."""
-        vehicle_requirements = Counter(mission.required_vehicle_types)
-        staff_requirements = Counter(mission.required_staff_types)
+        now = now or datetime.utcnow()
 
         vehicle_plan = self._plan_allocation(
-            vehicle_requirements,
-            self.content.vehicles,
-            "vehicle_type",
-            profile.get_available_vehicle_count,
+            mission.required_vehicle_counts,
+            self.content.vehicles_by_type,
+            lambda vehicle_id: profile.get_available_vehicle_count(vehicle_id, now),
         )
         staff_plan = self._plan_allocation(
-            staff_requirements,
-            self.content.staff,
-            "staff_type",
-            profile.get_available_staff_count,
+            mission.required_staff_counts,
+            self.content.staff_by_type,
+            lambda staff_id: profile.get_available_staff_count(staff_id, now),
         )
         return vehicle_plan, staff_plan
 
-    def get_available_dispatcher_count(self, profile: PlayerProfile) -> int:
+    def _fill_missing_plans(
+        self,
+        profile: PlayerProfile,
+        mission: Mission,
+        vehicle_plan: Optional[Counter],
+        staff_plan: Optional[Counter],
+        now: Optional[datetime] = None,
+    ) -> tuple[Counter, Counter]:
+        """Plan resources once for whichever of the given plans is missing or empty."""
+        if vehicle_plan and staff_plan:
+            return vehicle_plan, staff_plan
+        planned_vehicles, planned_staff = self.plan_resources_for_mission(profile, mission, now)
+        return vehicle_plan or planned_vehicles, staff_plan or planned_staff
+
+    def get_available_dispatcher_count(
+        self, profile: PlayerProfile, now: Optional[datetime] = None
+    ) -> int:
         """Return the number of dispatchers currently available."""
-        return profile.get_available_staff_count(DISPATCHER_STAFF_ID)
+        return profile.get_available_staff_count(DISPATCHER_STAFF_ID, now)
 
     def calculate_equipment_modifiers(
         self,
@@ -189,41 +218,46 @@ class GameEngine:
         mission: Mission,
         vehicle_plan: Optional[Counter] = None,
         staff_plan: Optional[Counter] = None,
+        now: Optional[datetime] = None,
     ) -> tuple[int, Counter, Counter]:
         """Return the effective mission duration after equipment plus the plans used."""
-        vehicle_plan = vehicle_plan or self.plan_resources_for_mission(profile, mission)[0]
-        staff_plan = staff_plan or self.plan_resources_for_mission(profile, mission)[1]
+        vehicle_plan, staff_plan = self._fill_missing_plans(
+            profile, mission, vehicle_plan, staff_plan, now
+        )
         equipment_modifiers = self.calculate_equipment_modifiers(profile, vehicle_plan, staff_plan)
         duration = max(1, int(mission.base_duration * equipment_modifiers["duration_multiplier"]))
         return duration, vehicle_plan, staff_plan
 
-    def get_dispatch_table_count(self, profile: PlayerProfile) -> int:
+    def get_dispatch_table_count(
+        self, profile: PlayerProfile, now: Optional[datetime] = None
+    ) -> int:
         """Number of dispatch tables available, including expansions."""
         tables = DISPATCH_BASE_TABLES
 
         # Each dispatcher adds another active table slot
-        tables = max(tables, self.get_available_dispatcher_count(profile))
+        tables = max(tables, self.get_available_dispatcher_count(profile, now))
 
-        for upgrade_id in profile.owned_upgrades:
-            upgrade = self.content.upgrades.get(upgrade_id)
-            if upgrade and upgrade.effect_type == "dispatch_capacity":
-                tables += int(upgrade.effect_value)
+        tables += profile.get_upgrade_effects(self.content.upgrades).dispatch_tables
 
         return max(1, tables)
 
-    def get_available_dispatch_slots(self, profile: PlayerProfile) -> int:
+    def get_available_dispatch_slots(
+        self, profile: PlayerProfile, now: Optional[datetime] = None
+    ) -> int:
         """
         Calculate how many dispatch slots are currently free for automation.
         Limited by dispatch tables and active missions already running.
         """
-        if not self.has_active_dispatcher(profile):
+        if not self.has_active_dispatcher(profile, now):
             return 0
 
-        tables = self.get_dispatch_table_count(profile)
+        tables = self.get_dispatch_table_count(profile, now)
         occupied = len(profile.active_missions)
         return max(0, tables - occupied)
 
-    def describe_automation_status(self, profile: PlayerProfile) -> Tuple[bool, str, int]:
+    def describe_automation_status(
+        self, profile: PlayerProfile, now: Optional[datetime] = None
+    ) -> Tuple[bool, str, int]:
         """Return (ready, message, available_slots) for automation state."""
         if not profile.automation_enabled:
             return False, "Automation is disabled", 0
@@ -231,10 +265,10 @@ class GameEngine:
         if not profile.has_automation_access():
             return False, "Dispatch Center upgrade required", 0
 
-        if not self.has_active_dispatcher(profile):
+        if not self.has_active_dispatcher(profile, now):
             return False, "No dispatcher on duty", 0
 
-        slots = self.get_available_dispatch_slots(profile)
+        slots = self.get_available_dispatch_slots(profile, now)
         if slots <= 0:
             return False, "All dispatch tables are currently busy", 0
 
@@ -248,6 +282,7 @@ class GameEngine:
         vehicle_plan: Optional[Counter] = None,
         staff_plan: Optional[Counter] = None,
         duration_override: Optional[int] = None,
+        now: Optional[datetime] = None,
     ) -> Dict[str, int]:
         """Calculate mission-specific operating costs (fuel, maintenance, salaries)."""
         costs = {
@@ -258,11 +293,7 @@ class GameEngine:
         }
 
         # Apply cost reduction upgrades to fuel only
-        cost_multiplier = 1.0
-        for upgrade_id in profile.owned_upgrades:
-            upgrade = self.content.upgrades.get(upgrade_id)
-            if upgrade and upgrade.effect_type == "cost_reduction":
-                cost_multiplier *= (1.0 - upgrade.effect_value)
+        cost_multiplier = profile.get_upgrade_effects(self.content.upgrades).cost_multiplier
 
         costs["fuel"] = max(1, int(costs["fuel"] * cost_multiplier))
 
@@ -270,14 +301,15 @@ class GameEngine:
         mission_duration = duration_override if duration_override is not None else mission.base_duration
         duration_factor = mission_duration / TickEngine.TICK_INTERVAL_MINUTES
 
-        vehicle_plan = vehicle_plan or self.plan_resources_for_mission(profile, mission)[0]
+        vehicle_plan, staff_plan = self._fill_missing_plans(
+            profile, mission, vehicle_plan, staff_plan, now
+        )
         for vehicle_id, used in vehicle_plan.items():
             vehicle = self.content.vehicles.get(vehicle_id)
             if not vehicle:
                 continue
             costs["maintenance"] += int(vehicle.maintenance_cost * duration_factor * used)
 
-        staff_plan = staff_plan or self.plan_resources_for_mission(profile, mission)[1]
         for staff_id, used in staff_plan.items():
             staff = self.content.staff.get(staff_id)
             if not staff:
@@ -287,9 +319,13 @@ class GameEngine:
         costs["total"] = max(1, costs["fuel"] + costs["maintenance"] + costs["salaries"])
         return costs
 
-    def calculate_dispatch_cost(self, profile: PlayerProfile, mission: Mission) -> int:
+    def calculate_dispatch_cost(
+        self, profile: PlayerProfile, mission: Mission, now: Optional[datetime] = None
+    ) -> int:
         """Calculate the total cost to dispatch a mission."""
-        duration, vehicle_plan, staff_plan = self.get_effective_mission_duration(profile, mission)
+        duration, vehicle_plan, staff_plan = self.get_effective_mission_duration(
+            profile, mission, now=now
+        )
         costs = self.calculate_mission_operating_costs(
             profile,
             mission,
@@ -306,17 +342,20 @@ class GameEngine:
         *,
         vehicle_plan: Optional[Counter] = None,
         staff_plan: Optional[Counter] = None,
+        district: Optional[District] = None,
+        now: Optional[datetime] = None,
     ) -> int:
         """Calculate mission success chance (0-100)."""
         base_chance = mission.base_success_chance
         
         # Apply district modifier
-        district = self.content.districts.get(profile.current_district)
+        district = district or self.content.districts.get(profile.current_district)
         if district:
             base_chance -= district.mission_difficulty_modifier
         
-        vehicle_plan = vehicle_plan or self.plan_resources_for_mission(profile, mission)[0]
-        staff_plan = staff_plan or self.plan_resources_for_mission(profile, mission)[1]
+        vehicle_plan, staff_plan = self._fill_missing_plans(
+            profile, mission, vehicle_plan, staff_plan, now
+        )
 
         # Apply staff bonuses
         staff_bonus = 0.0
@@ -329,11 +368,7 @@ class GameEngine:
             staff_bonus += (staff.success_bonus - 1.0)
         
         # Apply upgrade bonuses
-        upgrade_bonus = 0.0
-        for upgrade_id in profile.owned_upgrades:
-            upgrade = self.content.upgrades.get(upgrade_id)
-            if upgrade and upgrade.effect_type == "success_boost":
-                upgrade_bonus += upgrade.effect_value
+        upgrade_bonus = profile.get_upgrade_effects(self.content.upgrades).success_bonus
         
         equipment_modifiers = self.calculate_equipment_modifiers(profile, vehicle_plan, staff_plan)
 
@@ -347,10 +382,21 @@ class GameEngine:
         # Make failures slightly more likely overall
         final_chance -= self.FAILURE_CHANCE_PENALTY
 
-        return max(5, min(95, int(final_chance)))  # Clamp between 5-95%
+        chance = int(final_chance)
+        return 5 if chance < 5 else 95 if chance > 95 else chance  # Clamp between 5-95%
     
-    def calculate_mission_reward(self, profile: PlayerProfile, mission: Mission) -> int:
-        """Calculate mission reward amount."""
+    def calculate_mission_reward(
+        self,
+        profile: PlayerProfile,
+        mission: Mission,
+        dispatch_cost: Optional[int] = None,
+        district: Optional[District] = None,
+    ) -> int:
+        """Calculate mission reward amount.
+
+        Pass dispatch_cost or the profile's district when the caller already
+        has them to skip recomputing them.
+        """
         base_reward = mission.base_reward
 
         # Scale rewards by station level so higher-level stations earn more
@@ -358,20 +404,18 @@ class GameEngine:
         base_reward = int(base_reward * level_multiplier)
 
         # Apply district multiplier
-        district = self.content.districts.get(profile.current_district)
+        district = district or self.content.districts.get(profile.current_district)
         if district:
             base_reward = int(base_reward * district.mission_reward_multiplier)
         
         # Apply income boost upgrades
-        income_multiplier = 1.0
-        for upgrade_id in profile.owned_upgrades:
-            upgrade = self.content.upgrades.get(upgrade_id)
-            if upgrade and upgrade.effect_type == "income_boost":
-                income_multiplier *= (1.0 + upgrade.effect_value)
+        income_multiplier = profile.get_upgrade_effects(self.content.upgrades).income_multiplier
+        if income_multiplier != 1.0:
+            base_reward = int(base_reward * income_multiplier)
 
-        base_reward = int(base_reward * income_multiplier)
         # Ensure successful missions are always profitable relative to dispatch cost
-        dispatch_cost = self.calculate_dispatch_cost(profile, mission)
+        if dispatch_cost is None:
+            dispatch_cost = self.calculate_dispatch_cost(profile, mission)
         minimum_profitable_reward = int(dispatch_cost * (1 + self.PROFIT_MARGIN))
 
         base_reward = max(base_reward, minimum_profitable_reward)
@@ -380,19 +424,23 @@ class GameEngine:
     def dispatch_mission(
         self,
         profile: PlayerProfile,
-        mission: Mission
+        mission: Mission,
+        now: Optional[datetime] = None,
     ) -> Tuple[ActiveMission, int, str]:
         """
         Execute a mission dispatch.
         Returns (active_mission, cost_change, message)
         """
-        now = datetime.utcnow()
+        now = now or datetime.utcnow()
 
+        # Availability is read once here; allocation below reuses the same instant
+        vehicle_plan, staff_plan = self.plan_resources_for_mission(profile, mission, now)
         effective_duration, vehicle_plan, staff_plan = self.get_effective_mission_duration(
-            profile, mission
+            profile, mission, vehicle_plan, staff_plan, now
         )
 
         # Calculate costs and success odds up front
+        district = self.content.districts.get(profile.current_district)
         operating_costs = self.calculate_mission_operating_costs(
             profile,
             mission,
@@ -405,25 +453,32 @@ class GameEngine:
             mission,
             vehicle_plan=vehicle_plan,
             staff_plan=staff_plan,
+            district=district,
+        )
+        reward = self.calculate_mission_reward(
+            profile, mission, dispatch_cost=operating_costs["total"], district=district
         )
-        reward = self.calculate_mission_reward(profile, mission)
 
-        # Apply cooldowns to used resources
+        # Apply cooldowns to used resources, one allocation per cooldown length
+        vehicles_by_cooldown: Dict[int, Dict[str, int]] = {}
         for vehicle_id, assign in vehicle_plan.items():
             vehicle = self.content.vehicles.get(vehicle_id)
             if not vehicle or assign <= 0:
                 continue
-            cooldown_end = now + timedelta(minutes=vehicle.cooldown_minutes)
-            profile.allocate_vehicles(Counter({vehicle_id: assign}), cooldown_end)
+            vehicles_by_cooldown.setdefault(vehicle.cooldown_minutes, {})[vehicle_id] = assign
+        for cooldown_minutes, vehicle_counts in vehicles_by_cooldown.items():
+            profile.allocate_vehicles(vehicle_counts, now + _minutes(cooldown_minutes), now)
 
+        staff_by_cooldown: Dict[int, Dict[str, int]] = {}
         for staff_id, assign in staff_plan.items():
             staff = self.content.staff.get(staff_id)
             if not staff or assign <= 0:
                 continue
-            cooldown_end = now + timedelta(minutes=staff.cooldown_minutes)
-            profile.allocate_staff(Counter({staff_id: assign}), cooldown_end)
+            staff_by_cooldown.setdefault(staff.cooldown_minutes, {})[staff_id] = assign
+        for cooldown_minutes, staff_counts in staff_by_cooldown.items():
+            profile.allocate_staff(staff_counts, now + _minutes(cooldown_minutes), now)
 
-        mission_end_time = now + timedelta(minutes=effective_duration)
+        mission_end_time = now + _minutes(effective_duration)
         active_mission = ActiveMission(
             mission_id=mission.id,
             name=mission.name,
@@ -446,31 +501,31 @@ class GameEngine:
 
         return active_mission, -operating_costs["total"], message
 
-    def resolve_completed_missions(self, profile: PlayerProfile) -> Dict[str, int | list]:
-        """Resolve missions that have reached their end time."""
-        now = datetime.utcnow()
+    def resolve_completed_missions(
+        self, profile: PlayerProfile, now: Optional[datetime] = None
+    ) -> Dict[str, int | list]:
+        """Resolve missions that have reached their end time (naive UTC now)."""
+        now_ts = time.time() if now is None else now.replace(tzinfo=timezone.utc).timestamp()
         completed_messages: list[str] = []
         income = 0
         expenses = 0
         completed = 0
         failed = 0
 
-        remaining_missions = []
-        for mission_state in profile.active_missions:
-            if mission_state.ends_at > now:
-                remaining_missions.append(mission_state)
-                continue
+        ending_missions = profile.take_ended_missions(now_ts)
 
-            roll = random.randint(1, 100)
-            success = roll <= mission_state.success_chance
+        roll = random.random
+        for mission_state in ending_missions:
+            # Uniform in [0, 100): succeeds with probability success_chance / 100
+            success = roll() * 100.0 < mission_state.success_chance
 
             if success:
                 reward = mission_state.potential_reward
                 income += reward
                 profile.total_missions_completed += 1
                 profile.total_income_earned += reward
-                profile.reputation = min(100, profile.reputation + mission_state.reputation_success)
-                profile.heat_level = max(0, min(100, profile.heat_level + mission_state.heat_change))
+                profile.reputation = _clamp_percent(profile.reputation + mission_state.reputation_success)
+                profile.heat_level = _clamp_percent(profile.heat_level + mission_state.heat_change)
                 completed += 1
                 completed_messages.append(
                     f"✅ {mission_state.name} completed (+{reward} credits)"
@@ -478,15 +533,13 @@ class GameEngine:
             else:
                 # Costs were already paid upfront; failure just wastes the effort
                 profile.total_missions_failed += 1
-                profile.reputation = max(0, profile.reputation + mission_state.reputation_failure)
-                profile.heat_level = max(0, min(100, profile.heat_level + abs(mission_state.heat_change)))
+                profile.reputation = _clamp_percent(profile.reputation + mission_state.reputation_failure)
+                profile.heat_level = _clamp_percent(profile.heat_level + abs(mission_state.heat_change))
                 failed += 1
                 completed_messages.append(
                     f"❌ {mission_state.name} failed (no reward)"
                 )
 
-        profile.active_missions = remaining_missions
-
         return {
             "income": income,
             "expenses": expenses,
@@ -501,18 +554,31 @@ class GameEngine:
         if user:
             return user
 
+        user = self._bank_users.get(user_id)
+        if user:
+            self._bank_users.move_to_end(user_id)
+            return user
+
         try:
-            return await self.bot.fetch_user(user_id)
+            user = await self.bot.fetch_user(user_id)
         except Exception as e:
-            log.error(f"Failed to resolve user {user_id} for bank operations: {e}")
+            log.error("Failed to resolve user %s for bank operations: %s", user_id, e)
             return None
 
-    async def check_sufficient_balance(self, user_id: int, amount: int) -> Tuple[bool, int]:
+        self._bank_users[user_id] = user
+        if len(self._bank_users) > self.BANK_USER_CACHE_SIZE:
+            self._bank_users.popitem(last=False)
+        return user
+
+    async def check_sufficient_balance(
+        self, user_id: int, amount: int, user: Optional[discord.abc.User] = None
+    ) -> Tuple[bool, int]:
         """
         Check if user has sufficient balance for a transaction.
+        Pass user when the caller already holds it to skip resolving it.
         Returns (has_sufficient, current_balance)
         """
-        user = await self._resolve_bank_user(user_id)
+        user = user or await self._resolve_bank_user(user_id)
         if not user:
             return False, 0
 
@@ -521,52 +587,57 @@ class GameEngine:
             # Allow going into debt, but check minimum for dispatch
             return balance >= amount, balance
         except Exception as e:
-            log.error(f"Error fetching balance for user {user_id}: {e}")
-            return None
+            log.error("Error fetching balance for user %s: %s", user_id, e)
+            return False, 0
     
     async def apply_bank_transaction(
         self,
         user_id: int,
         amount: int,
-        reason: str
+        reason: str,
+        user: Optional[discord.abc.User] = None,
     ) -> Tuple[bool, Optional[int]]:
         """
         Apply a bank transaction (positive = deposit, negative = withdraw).
+        Pass user when the caller already holds it to skip resolving it.
         Returns (success, new_balance)
         """
-        user = await self._resolve_bank_user(user_id)
+        user = user or await self._resolve_bank_user(user_id)
         if not user:
             return False, None
 
         try:
             if amount > 0:
-                # Deposit
-                await bank.deposit_credits(user, amount)
-                new_balance = await bank.get_balance(user)
-                log.info(f"Deposited {amount} credits to user {user_id} - {reason}")
+                # Deposit; Red returns the new balance
+                new_balance = await bank.deposit_credits(user, amount)
+                log.info("Deposited %s credits to user %s - %s", amount, user_id, reason)
                 return True, new_balance
             elif amount < 0:
-                # Withdraw
-                await bank.withdraw_credits(user, abs(amount))
-                new_balance = await bank.get_balance(user)
-                log.info(f"Withdrew {abs(amount)} credits from user {user_id} - {reason}")
+                # Withdraw; Red returns the new balance
+                new_balance = await bank.withdraw_credits(user, abs(amount))
+                log.info("Withdrew %s credits from user %s - %s", -amount, user_id, reason)
                 return True, new_balance
             else:
                 # No transaction
                 balance = await bank.get_balance(user)
                 return True, balance
         except Exception as e:
-            log.error(f"Bank transaction failed for user {user_id} ({reason}): {e}")
+            log.error("Bank transaction failed for user %s (%s): %s", user_id, reason, e)
             return False, None
 
-    async def get_balance(self, user_id: int) -> Optional[int]:
-        """Return the user's current bank balance."""
-        user = await self._resolve_bank_user(user_id)
+    async def get_balance(
+        self, user_id: int, user: Optional[discord.abc.User] = None
+    ) -> Optional[int]:
+        """Return the user's current bank balance.
+
+        Pass user when the caller already holds it to skip resolving it.
+        """
+        user = user or await self._resolve_bank_user(user_id)
         if not user:
             return None
 
         try:
             return await bank.get_balance(user)
         except Exception as e:
-            log.error(f"Error fetching balance for user {user_id}: {e}")
+            log.error("Error fetching balance for user %s: %s", user_id, e)
             return None
@@ -6,7 +6,7 @@ Author: BrandjuhNL
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import List
+from typing import List, Optional, Set
 from discord.ext import tasks
 
 from ..models import PlayerProfile
@@ -48,7 +48,7 @@ class TickEngine:
             # catch-up when users interact
             # In production, you'd want to fetch all profiles and process them
         except Exception as e:
-            log.error(f"Error in tick loop: {e}", exc_info=True)
+            log.error("Error in tick loop: %s", e, exc_info=True)
     
     async def process_catchup(self, profile: PlayerProfile) -> List[str]:
         """
@@ -75,7 +75,7 @@ class TickEngine:
         ticks_to_process = int(time_since_last.total_seconds() / (self.TICK_INTERVAL_MINUTES * 60))
 
         if ticks_to_process > 0:
-            log.info(f"Processing {ticks_to_process} catch-up ticks for user {profile.user_id}")
+            log.info("Processing %s catch-up ticks for user %s", ticks_to_process, profile.user_id)
 
         # Process each tick
         total_income = 0
@@ -84,7 +84,7 @@ class TickEngine:
         missions_failed = 0
 
         # Resolve any missions that already finished while the player was away
-        resolution = self.game_engine.resolve_completed_missions(profile)
+        resolution = self.game_engine.resolve_completed_missions(profile, now)
         total_income += resolution["income"]
         total_expenses += resolution["expenses"]
         missions_completed += resolution["completed"]
@@ -92,16 +92,22 @@ class TickEngine:
         if resolution["messages"]:
             messages.extend(resolution["messages"])
 
+        # Earnings and costs are only settled after the loop, so the balance
+        # automation checks against stays the same for the whole catch-up
+        balance = None
+        if ticks_to_process > 0 and profile.automation_enabled and profile.has_automation_access():
+            balance = await self.game_engine.get_balance(profile.user_id)
+
         for i in range(ticks_to_process):
             # If automation is enabled and dispatch center is available (upgrade or special access)
             if profile.automation_enabled and profile.has_automation_access():
                 # Auto-dispatch missions based on policies
-                auto_results = await self._auto_dispatch_missions(profile)
+                auto_results = await self._auto_dispatch_missions(profile, balance, now)
                 total_income += auto_results["income"]
                 total_expenses += auto_results["expenses"]
 
         # Resolve again in case automated missions ended during the catch-up window
-        resolution = self.game_engine.resolve_completed_missions(profile)
+        resolution = self.game_engine.resolve_completed_missions(profile, now)
         total_income += resolution["income"]
         total_expenses += resolution["expenses"]
         missions_completed += resolution["completed"]
@@ -141,9 +147,13 @@ class TickEngine:
         
         return messages
     
-    async def _auto_dispatch_missions(self, profile: PlayerProfile) -> dict:
+    async def _auto_dispatch_missions(
+        self, profile: PlayerProfile, balance: Optional[int], now: datetime
+    ) -> dict:
         """
         Automatically dispatch missions based on policies.
+        balance is the player's bank balance, or None when it could not be read;
+        now is the catch-up's reference time.
         Returns dict with income, expenses, completed, failed counts.
         """
         results = {
@@ -159,7 +169,7 @@ class TickEngine:
             profile.station_level
         )
         
-        ready, _, available_slots = self.game_engine.describe_automation_status(profile)
+        ready, _, available_slots = self.game_engine.describe_automation_status(profile, now)
         if not ready:
             return results
 
@@ -168,6 +178,7 @@ class TickEngine:
             return results
 
         dispatched = 0
+        district = self.content.districts.get(profile.current_district)
 
         # Try to dispatch missions based on active policies
         for mission in missions:
@@ -175,7 +186,7 @@ class TickEngine:
                 break
 
             # Check if we can dispatch
-            can_dispatch, _ = self.game_engine.can_dispatch_mission(profile, mission)
+            can_dispatch, _ = self.game_engine.can_dispatch_mission(profile, mission, now)
             if not can_dispatch:
                 continue
 
@@ -184,17 +195,20 @@ class TickEngine:
                 continue
 
             # Calculate cost and check balance
-            cost = self.game_engine.calculate_dispatch_cost(profile, mission)
+            cost = self.game_engine.calculate_dispatch_cost(profile, mission, now)
 
             # Skip missions that are expected to lose money to reduce negative cashflow
-            success_chance = self.game_engine.calculate_success_chance(profile, mission) / 100
-            reward = self.game_engine.calculate_mission_reward(profile, mission)
+            success_chance = self.game_engine.calculate_success_chance(
+                profile, mission, district=district, now=now
+            ) / 100
+            reward = self.game_engine.calculate_mission_reward(
+                profile, mission, dispatch_cost=cost, district=district
+            )
             expected_profit = (success_chance * reward) - cost
 
             if expected_profit <= 0:
                 continue
 
-            balance = await self.game_engine.get_balance(profile.user_id)
             if balance is None:
                 continue
 
@@ -202,7 +216,7 @@ class TickEngine:
                 continue
 
             # Dispatch the mission
-            _, amount, _ = self.game_engine.dispatch_mission(profile, mission)
+            _, amount, _ = self.game_engine.dispatch_mission(profile, mission, now)
             # amount is negative because it represents costs paid upfront
             results["expenses"] += abs(amount)
 
@@ -210,7 +224,7 @@ class TickEngine:
         
         return results
     
-    def _matches_policy(self, mission, active_policies: List[str]) -> bool:
+    def _matches_policy(self, mission, active_policies: Set[str]) -> bool:
         """Check if a mission matches any active policy."""
         if not active_policies:
             return True
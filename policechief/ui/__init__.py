@@ -2,6 +2,7 @@
 UI layer for PoliceChief
 """
 
+from .base import get_attached_view
 from .controller import InteractionController
 from .dashboard import DashboardView
 from .helpers import build_error_embed, build_success_embed, format_time_remaining
@@ -14,4 +15,5 @@ __all__ = [
     "build_error_embed",
     "build_success_embed",
     "format_time_remaining",
+    "get_attached_view",
 ]
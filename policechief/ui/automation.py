@@ -72,7 +72,7 @@ class AutomationView(BaseView):
         # Show active policies
         if self.profile.active_policies:
             policy_list = []
-            for policy_id in self.profile.active_policies:
+            for policy_id in sorted(self.profile.active_policies):
                 policy = self.cog.content_loader.policies.get(policy_id)
                 if policy:
                     policy_list.append(f"✅ {policy.name}")
@@ -1,10 +1,24 @@
 """Shared UI base classes for PoliceChief views."""
 
 import logging
+import weakref
+from typing import Optional
+
 import discord
 
 log = logging.getLogger("red.policechief.ui")
 
+# Message ID -> the view most recently attached to that message
+_attached_views: "weakref.WeakValueDictionary[int, BaseView]" = weakref.WeakValueDictionary()
+
+
+def get_attached_view(message_id: int) -> Optional["BaseView"]:
+    """Return the live view currently driving a message, if any."""
+    view = _attached_views.get(message_id)
+    if view is None or view.is_finished():
+        return None
+    return view
+
 
 class BaseView(discord.ui.View):
     """Base view that removes components after timing out."""
@@ -18,6 +32,8 @@ class BaseView(discord.ui.View):
     def attach_message(self, message: discord.Message) -> "BaseView":
         """Bind the view to a message so we can clean it up on timeout."""
         self.message = message
+        if message is not None:
+            _attached_views[message.id] = self
         return self
 
     async def on_timeout(self) -> None:
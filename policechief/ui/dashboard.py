@@ -4,7 +4,8 @@ Author: BrandjuhNL
 """
 
 import discord
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 
 from .base import BaseView
 from .helpers import build_info_embed, format_credits
@@ -19,6 +20,8 @@ class DashboardView(BaseView):
         self.cog = cog
         self.profile = profile
         self.user = user
+        # Hash of the embed last sent with this view, when known
+        self.embed_fingerprint: Optional[int] = None
 
         # Add buttons
         self.add_item(StatusButton())
@@ -40,73 +43,134 @@ class DashboardView(BaseView):
         self.add_item(RefreshButton())
         self.add_item(CloseDashboardButton())
     
+    def reset(self, profile: PlayerProfile, user: discord.User) -> bool:
+        """Rebind this live view to fresh profile state instead of rebuilding it.
+
+        Returns False when the button layout would differ, in which case a new
+        view has to be created.
+        """
+        if profile.has_automation_access() != self.profile.has_automation_access():
+            return False
+        self.profile = profile
+        self.user = user
+        return True
+
     async def build_embed(self) -> discord.Embed:
         """Build the dashboard embed."""
         # Get current balance
-        balance = await self.cog.game_engine.get_balance(self.user.id)
+        balance = await self.cog.game_engine.get_balance(self.user.id, user=self.user)
         if balance is None:
             balance = 0
         
-        embed = build_info_embed(
-            f"🚔 {self.profile.station_name}",
-            f"Welcome, Chief {self.user.display_name}!"
-        )
-        
-        embed.add_field(
-            name="Station Info",
-            value=(
-                f"Level: {self.profile.station_level}\n"
-                f"District: {self.profile.current_district.title()}\n"
-                f"Reputation: {self.profile.reputation}/100"
-            ),
-            inline=True
-        )
-        
-        embed.add_field(
-            name="Resources",
-            value=(
-                f"Balance: {format_credits(balance)} credits\n"
-                f"Heat: {self.profile.heat_level}/100\n"
-                f"Automation: {'ON' if self.profile.automation_enabled else 'OFF'}"
-            ),
-            inline=True
-        )
-        
         # Count vehicles and staff with capacity info
         vehicle_limit = self.profile.get_vehicle_capacity_limit()
-        vehicle_text = (
-            f"{self.profile.total_vehicle_count}/{vehicle_limit}"
-            if vehicle_limit is not None
-            else str(self.profile.total_vehicle_count)
-        )
-
         staff_capacity = self.profile.get_staff_capacity(self.cog.content_loader.vehicles)
-        seated_staff = self.profile.get_seated_staff_count(self.cog.content_loader.staff)
-        staff_text = f"{seated_staff}/{staff_capacity}" if staff_capacity else "0/0"
+        seated_staff = self.profile.get_seated_staff_count(self.cog.content_loader.unseated_staff_ids)
         prisoner_capacity = self.profile.get_prisoner_capacity(self.cog.content_loader.vehicles)
-        holding_cells = self.profile.get_holding_cell_capacity()
-
-        embed.add_field(
-            name="Fleet & Staff",
-            value=(
-                f"Vehicles: {vehicle_text}\n"
-                f"Staff Seats Filled: {staff_text}\n"
-                f"Prisoner Transport: {prisoner_capacity} slots\n"
-                f"Holding Cells: {holding_cells} (transfer to prison)\n"
-                f"Missions: {self.profile.total_missions_completed} completed"
-            ),
-            inline=True
+
+        # Everything the embed shows; identical states reuse the rendered dict
+        state = (
+            self.profile.station_name,
+            self.user.display_name,
+            self.profile.station_level,
+            self.profile.current_district,
+            self.profile.reputation,
+            balance,
+            self.profile.heat_level,
+            bool(self.profile.automation_enabled),
+            self.profile.total_vehicle_count,
+            vehicle_limit,
+            seated_staff,
+            staff_capacity,
+            prisoner_capacity,
+            self.profile.get_holding_cell_capacity(),
+            self.profile.total_missions_completed,
+        )
+        rendered = _render_dashboard(state)
+        # Fresh field/footer dicts so callers can add fields without touching the cache
+        return discord.Embed.from_dict(
+            {
+                **rendered,
+                "fields": [dict(embed_field) for embed_field in rendered["fields"]],
+                "footer": dict(rendered["footer"]),
+            }
         )
-        
-        embed.set_footer(text="Use the buttons below to navigate")
-        
-        return embed
     
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         """Validate interaction."""
         return await self.cog.controller.validate_interaction(interaction, self.profile.user_id)
 
 
+@lru_cache(maxsize=256)
+def _render_dashboard(state: Tuple) -> dict:
+    """Render the dashboard embed for a state tuple built by DashboardView."""
+    (
+        station_name,
+        display_name,
+        station_level,
+        current_district,
+        reputation,
+        balance,
+        heat_level,
+        automation_enabled,
+        vehicle_count,
+        vehicle_limit,
+        seated_staff,
+        staff_capacity,
+        prisoner_capacity,
+        holding_cells,
+        missions_completed,
+    ) = state
+
+    embed = build_info_embed(
+        f"🚔 {station_name}",
+        f"Welcome, Chief {display_name}!"
+    )
+
+    embed.add_field(
+        name="Station Info",
+        value=(
+            f"Level: {station_level}\n"
+            f"District: {current_district.title()}\n"
+            f"Reputation: {reputation}/100"
+        ),
+        inline=True
+    )
+
+    embed.add_field(
+        name="Resources",
+        value=(
+            f"Balance: {format_credits(balance)} credits\n"
+            f"Heat: {heat_level}/100\n"
+            f"Automation: {'ON' if automation_enabled else 'OFF'}"
+        ),
+        inline=True
+    )
+
+    vehicle_text = (
+        f"{vehicle_count}/{vehicle_limit}"
+        if vehicle_limit is not None
+        else str(vehicle_count)
+    )
+    staff_text = f"{seated_staff}/{staff_capacity}" if staff_capacity else "0/0"
+
+    embed.add_field(
+        name="Fleet & Staff",
+        value=(
+            f"Vehicles: {vehicle_text}\n"
+            f"Staff Seats Filled: {staff_text}\n"
+            f"Prisoner Transport: {prisoner_capacity} slots\n"
+            f"Holding Cells: {holding_cells} (transfer to prison)\n"
+            f"Missions: {missions_completed} completed"
+        ),
+        inline=True
+    )
+
+    embed.set_footer(text="Use the buttons below to navigate")
+
+    return embed.to_dict()
+
+
 class StatusButton(discord.ui.Button):
     """Status button."""
     
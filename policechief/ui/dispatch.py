@@ -3,7 +3,7 @@ Dispatch view - mission selection and execution
 Author: BrandjuhNL
 """
 
-from datetime import datetime
+import time
 
 import discord
 
@@ -35,7 +35,7 @@ class DispatchView(BaseView):
     
     async def build_embed(self) -> discord.Embed:
         """Build the dispatch embed."""
-        balance = await self.cog.game_engine.get_balance(self.user.id)
+        balance = await self.cog.game_engine.get_balance(self.user.id, user=self.user)
         display_balance = balance if balance is not None else 0
         
         embed = build_info_embed(
@@ -159,7 +159,7 @@ class MissionDetailView(BaseView):
     
     async def build_embed(self) -> discord.Embed:
         """Build mission detail embed."""
-        balance = await self.cog.game_engine.get_balance(self.user.id)
+        balance = await self.cog.game_engine.get_balance(self.user.id, user=self.user)
         display_balance = balance if balance is not None else 0
         
         embed = build_info_embed(
@@ -177,7 +177,6 @@ class MissionDetailView(BaseView):
             vehicle_plan=vehicle_plan,
             staff_plan=staff_plan,
         )
-        reward = self.cog.game_engine.calculate_mission_reward(self.profile, self.mission)
         cost_breakdown = self.cog.game_engine.calculate_mission_operating_costs(
             self.profile,
             self.mission,
@@ -186,6 +185,9 @@ class MissionDetailView(BaseView):
             duration_override=duration,
         )
         cost = cost_breakdown["total"]
+        reward = self.cog.game_engine.calculate_mission_reward(
+            self.profile, self.mission, dispatch_cost=cost
+        )
         
         embed.add_field(
             name="Mission Info",
@@ -269,7 +271,7 @@ class DispatchButton(discord.ui.Button):
     
     async def callback(self, interaction: discord.Interaction):
         # Double-check balance
-        balance = await self.view.cog.game_engine.get_balance(interaction.user.id)
+        balance = await self.view.cog.game_engine.get_balance(interaction.user.id, user=interaction.user)
         if balance is None:
             await interaction.response.send_message(
                 embed=build_error_embed("Error", "Failed to check balance"),
@@ -299,7 +301,8 @@ class DispatchButton(discord.ui.Button):
         bank_success, new_balance = await self.view.cog.game_engine.apply_bank_transaction(
             interaction.user.id,
             amount,
-            f"Mission: {self.mission.name}"
+            f"Mission: {self.mission.name}",
+            user=interaction.user,
         )
         
         if not bank_success:
@@ -383,14 +386,15 @@ class ActiveMissionsView(BaseView):
 
     async def build_embed(self) -> discord.Embed:
         """Build the active missions embed."""
-        now = datetime.utcnow()
+        now_ts = time.time()
 
         embed = build_info_embed(
             "🕒 Active Missions",
             "Missions currently in progress."
         )
 
-        active = sorted(self.profile.active_missions, key=lambda mission: mission.ends_at)
+        # Kept sorted by end time on the profile
+        active = self.profile.active_missions
 
         if not active:
             embed.add_field(
@@ -403,7 +407,7 @@ class ActiveMissionsView(BaseView):
         mission_lines = []
         for mission in active:
             eta = mission.ends_at.strftime("%H:%M UTC")
-            remaining = mission.remaining_minutes(now)
+            remaining = mission.remaining_minutes(now_ts)
             mission_lines.append(
                 f"• **{mission.name}** – {remaining}m remaining (eta {eta})"
             )
@@ -29,7 +29,7 @@ class DistrictsView(BaseView):
     
     async def build_embed(self) -> discord.Embed:
         """Build the districts embed."""
-        balance = await self.cog.game_engine.get_balance(self.user.id)
+        balance = await self.cog.game_engine.get_balance(self.user.id, user=self.user)
         display_balance = balance if balance is not None else 0
         
         embed = build_info_embed(
@@ -46,7 +46,7 @@ class DistrictsView(BaseView):
         # Show unlocked districts
         if self.profile.unlocked_districts:
             district_list = []
-            for district_id in self.profile.unlocked_districts:
+            for district_id in sorted(self.profile.unlocked_districts):
                 district = self.cog.content_loader.districts.get(district_id)
                 if district:
                     current = "📍" if district_id == self.profile.current_district else "🔓"
@@ -150,7 +150,7 @@ class DistrictSelect(discord.ui.Select):
             return
         
         # Need to unlock - check balance
-        balance = await self.view.cog.game_engine.get_balance(interaction.user.id)
+        balance = await self.view.cog.game_engine.get_balance(interaction.user.id, user=interaction.user)
         if balance is None:
             await interaction.response.send_message(
                 embed=build_error_embed("Error", "Failed to check balance"),
@@ -172,7 +172,8 @@ class DistrictSelect(discord.ui.Select):
         bank_success, new_balance = await self.view.cog.game_engine.apply_bank_transaction(
             interaction.user.id,
             -district.unlock_cost,
-            f"Unlocked district: {district.name}"
+            f"Unlocked district: {district.name}",
+            user=interaction.user,
         )
         
         if not bank_success:
@@ -183,7 +184,7 @@ class DistrictSelect(discord.ui.Select):
             return
         
         # Add district to profile
-        self.view.profile.unlocked_districts.append(district_id)
+        self.view.profile.unlock_district(district_id)
         self.view.profile.current_district = district_id  # Auto-switch to new district
         await self.view.cog.repository.save_profile(self.view.profile)
         
@@ -77,7 +77,7 @@ class EquipmentView(BaseView):
         self.add_item(BackButton())
 
     async def build_embed(self) -> discord.Embed:
-        balance = await self.cog.game_engine.get_balance(self.user.id)
+        balance = await self.cog.game_engine.get_balance(self.user.id, user=self.user)
         display_balance = balance if balance is not None else 0
 
         embed = build_info_embed(
@@ -166,7 +166,7 @@ class EquipmentPurchaseSelect(discord.ui.Select):
             )
             return
 
-        balance = await self.view.cog.game_engine.get_balance(interaction.user.id)
+        balance = await self.view.cog.game_engine.get_balance(interaction.user.id, user=interaction.user)
         if balance is None:
             await interaction.response.send_message(
                 embed=build_error_embed("Error", "Failed to check balance."),
@@ -188,6 +188,7 @@ class EquipmentPurchaseSelect(discord.ui.Select):
             interaction.user.id,
             -equipment.purchase_cost,
             f"Purchased equipment: {equipment.name}",
+            user=interaction.user,
         )
 
         if not success:
@@ -263,6 +264,7 @@ class EquipmentSellSelect(discord.ui.Select):
             interaction.user.id,
             equipment.sell_value,
             f"Sold equipment: {equipment.name}",
+            user=interaction.user,
         )
 
         if not success:
@@ -20,7 +20,7 @@ class FinancesView(BaseView):
 
     async def build_embed(self) -> discord.Embed:
         """Build a detailed financial overview embed."""
-        balance = await self.cog.game_engine.get_balance(self.user.id)
+        balance = await self.cog.game_engine.get_balance(self.user.id, user=self.user)
         display_balance = balance if balance is not None else 0
 
         embed = build_info_embed(
@@ -146,9 +146,10 @@ class FinancesView(BaseView):
         """Return dispatch cost multiplier and formatted list of reductions."""
         multiplier = 1.0
         reductions: list[str] = []
-        for upgrade_id in self.profile.owned_upgrades:
-            upgrade = self.cog.content_loader.upgrades.get(upgrade_id)
-            if upgrade and upgrade.effect_type == "cost_reduction":
+        content = self.cog.content_loader
+        for upgrade_id in content.upgrades_by_effect.get("cost_reduction", ()):
+            if upgrade_id in self.profile.owned_upgrades:
+                upgrade = content.upgrades[upgrade_id]
                 multiplier *= 1.0 - upgrade.effect_value
                 reductions.append(
                     f"⬇️ {upgrade.name}: -{int(upgrade.effect_value * 100)}% fuel/dispatch"
@@ -162,9 +163,10 @@ class FinancesView(BaseView):
     def _build_income_boost_details(self) -> tuple[str, bool]:
         boosts: list[str] = []
         multiplier = 1.0
-        for upgrade_id in self.profile.owned_upgrades:
-            upgrade = self.cog.content_loader.upgrades.get(upgrade_id)
-            if upgrade and upgrade.effect_type == "income_boost":
+        content = self.cog.content_loader
+        for upgrade_id in content.upgrades_by_effect.get("income_boost", ()):
+            if upgrade_id in self.profile.owned_upgrades:
+                upgrade = content.upgrades[upgrade_id]
                 multiplier *= 1.0 + upgrade.effect_value
                 boosts.append(
                     f"📈 {upgrade.name}: +{int(upgrade.effect_value * 100)}% mission income"
@@ -4,6 +4,7 @@ Author: BrandjuhNL
 """
 
 import discord
+from datetime import datetime
 
 from .base import BaseView
 from .helpers import build_info_embed, build_error_embed, build_success_embed, format_credits, format_time_remaining
@@ -32,7 +33,7 @@ class FleetView(BaseView):
 
     async def build_embed(self) -> discord.Embed:
         """Build the fleet embed."""
-        balance = await self.cog.game_engine.get_balance(self.user.id)
+        balance = await self.cog.game_engine.get_balance(self.user.id, user=self.user)
         display_balance = balance if balance is not None else 0
 
         embed = build_info_embed(
@@ -50,14 +51,16 @@ class FleetView(BaseView):
         # Show owned vehicles
         if self.profile.owned_vehicles:
             vehicle_list = []
+            now = datetime.utcnow()
             for vehicle_id, quantity in self.profile.owned_vehicles.items():
                 vehicle = self.cog.content_loader.vehicles.get(vehicle_id)
                 if vehicle:
-                    available = self.profile.get_available_vehicle_count(vehicle_id)
+                    available = self.profile.get_available_vehicle_count(vehicle_id, now)
                     status = "🟢" if available > 0 else "🔴"
                     cooldown_text = ""
-                    if vehicle_id in self.profile.vehicle_cooldowns:
-                        cooldown_text = f" ({format_time_remaining(self.profile.vehicle_cooldowns[vehicle_id])})"
+                    ready_at = self.profile.get_next_vehicle_ready_time(vehicle_id, now)
+                    if ready_at:
+                        cooldown_text = f" ({format_time_remaining(ready_at, now)})"
                     vehicle_list.append(
                         f"{status} {vehicle.name} x{quantity}"
                         f" (ready: {available}){cooldown_text}"
@@ -147,7 +150,7 @@ class VehicleSelect(discord.ui.Select):
             return
 
         # Check balance
-        balance = await self.view.cog.game_engine.get_balance(interaction.user.id)
+        balance = await self.view.cog.game_engine.get_balance(interaction.user.id, user=interaction.user)
         if balance is None:
             await interaction.response.send_message(
                 embed=build_error_embed("Error", "Failed to check balance"),
@@ -170,6 +173,7 @@ class VehicleSelect(discord.ui.Select):
             interaction.user.id,
             -vehicle.purchase_cost,
             f"Purchased vehicle: {vehicle.name}",
+            user=interaction.user,
         )
 
         if not bank_success:
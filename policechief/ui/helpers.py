@@ -38,26 +38,30 @@ def build_info_embed(title: str, description: str) -> discord.Embed:
     return embed
 
 
-def _next_timestamp(targets: Iterable[datetime]) -> Optional[datetime]:
+def _next_timestamp(
+    targets: Iterable[datetime], now: Optional[datetime] = None
+) -> Optional[datetime]:
     """Return the soonest timestamp in the iterable that is still in the future."""
-    now = datetime.utcnow()
+    now = now or datetime.utcnow()
     upcoming = [ts for ts in targets if ts and ts > now]
     if not upcoming:
         return None
     return min(upcoming)
 
 
-def format_time_remaining(target_time: Union[datetime, Iterable[datetime]]) -> str:
+def format_time_remaining(
+    target_time: Union[datetime, Iterable[datetime]], now: Optional[datetime] = None
+) -> str:
     """Format remaining time until target_time.
 
     Supports a single datetime or an iterable of datetimes (e.g., multiple cooldowns).
     """
-    now = datetime.utcnow()
+    now = now or datetime.utcnow()
 
     if isinstance(target_time, datetime):
         target = target_time
     else:
-        target = _next_timestamp(target_time)
+        target = _next_timestamp(target_time, now)
         if target is None:
             return "Ready"
 
@@ -4,6 +4,7 @@ Author: BrandjuhNL
 """
 
 import discord
+from datetime import datetime
 
 from .base import BaseView
 from .helpers import build_info_embed, build_error_embed, build_success_embed, format_credits, format_time_remaining
@@ -32,7 +33,7 @@ class StaffView(BaseView):
 
     async def build_embed(self) -> discord.Embed:
         """Build the staff embed."""
-        balance = await self.cog.game_engine.get_balance(self.user.id)
+        balance = await self.cog.game_engine.get_balance(self.user.id, user=self.user)
         display_balance = balance if balance is not None else 0
 
         embed = build_info_embed(
@@ -41,20 +42,22 @@ class StaffView(BaseView):
         )
 
         staff_capacity = self.profile.get_staff_capacity(self.cog.content_loader.vehicles)
-        seated_staff = self.profile.get_seated_staff_count(self.cog.content_loader.staff)
+        seated_staff = self.profile.get_seated_staff_count(self.cog.content_loader.unseated_staff_ids)
         staff_capacity_text = f"{seated_staff}/{staff_capacity}" if staff_capacity else "0"
 
         # Show hired staff
         if self.profile.staff_roster:
             staff_list = []
+            now = datetime.utcnow()
             for staff_id, quantity in self.profile.staff_roster.items():
                 staff = self.cog.content_loader.staff.get(staff_id)
                 if staff:
-                    available = self.profile.get_available_staff_count(staff_id)
+                    available = self.profile.get_available_staff_count(staff_id, now)
                     status = "🟢" if available > 0 else "🔴"
                     cooldown_text = ""
-                    if staff_id in self.profile.staff_cooldowns:
-                        cooldown_text = f" ({format_time_remaining(self.profile.staff_cooldowns[staff_id])})"
+                    ready_at = self.profile.get_next_staff_ready_time(staff_id, now)
+                    if ready_at:
+                        cooldown_text = f" ({format_time_remaining(ready_at, now)})"
                     staff_list.append(
                         f"{status} {staff.name} x{quantity}"
                         f" (ready: {available}){cooldown_text}"
@@ -132,7 +135,7 @@ class StaffSelect(discord.ui.Select):
             return
 
         staff_capacity = self.view.profile.get_staff_capacity(self.view.cog.content_loader.vehicles)
-        seated_staff = self.view.profile.get_seated_staff_count(self.view.cog.content_loader.staff)
+        seated_staff = self.view.profile.get_seated_staff_count(self.view.cog.content_loader.unseated_staff_ids)
         if staff.requires_vehicle and seated_staff >= staff_capacity:
             await interaction.response.send_message(
                 embed=build_error_embed(
@@ -144,7 +147,7 @@ class StaffSelect(discord.ui.Select):
             return
 
         # Check balance
-        balance = await self.view.cog.game_engine.get_balance(interaction.user.id)
+        balance = await self.view.cog.game_engine.get_balance(interaction.user.id, user=interaction.user)
         if balance is None:
             await interaction.response.send_message(
                 embed=build_error_embed("Error", "Failed to check balance"),
@@ -167,6 +170,7 @@ class StaffSelect(discord.ui.Select):
             interaction.user.id,
             -staff.hire_cost,
             f"Hired staff: {staff.name}",
+            user=interaction.user,
         )
 
         if not bank_success:
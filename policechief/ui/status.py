@@ -25,7 +25,7 @@ class StatusView(BaseView):
     async def build_embed(self) -> discord.Embed:
         """Build the status embed."""
         # Get current balance
-        balance = await self.cog.game_engine.get_balance(self.user.id)
+        balance = await self.cog.game_engine.get_balance(self.user.id, user=self.user)
         display_balance = balance if balance is not None else 0
         
         embed = build_info_embed(
@@ -63,7 +63,7 @@ class StatusView(BaseView):
             else str(self.profile.total_vehicle_count)
         )
         staff_capacity = self.profile.get_staff_capacity(self.cog.content_loader.vehicles)
-        seated_staff = self.profile.get_seated_staff_count(self.cog.content_loader.staff)
+        seated_staff = self.profile.get_seated_staff_count(self.cog.content_loader.unseated_staff_ids)
         staff_text = f"{seated_staff}/{staff_capacity}" if staff_capacity else "0/0"
         prisoner_capacity = self.profile.get_prisoner_capacity(self.cog.content_loader.vehicles)
         holding_cells = self.profile.get_holding_cell_capacity()
@@ -32,7 +32,7 @@ class UpgradesView(BaseView):
     
     async def build_embed(self) -> discord.Embed:
         """Build the upgrades embed."""
-        balance = await self.cog.game_engine.get_balance(self.user.id)
+        balance = await self.cog.game_engine.get_balance(self.user.id, user=self.user)
         display_balance = balance if balance is not None else 0
         
         embed = build_info_embed(
@@ -43,7 +43,7 @@ class UpgradesView(BaseView):
         # Show owned upgrades
         if self.profile.owned_upgrades:
             upgrade_list = []
-            for upgrade_id in self.profile.owned_upgrades:
+            for upgrade_id in sorted(self.profile.owned_upgrades):
                 upgrade = self.cog.content_loader.upgrades.get(upgrade_id)
                 if upgrade:
                     upgrade_list.append(f"✅ {upgrade.name}")
@@ -132,7 +132,7 @@ class UpgradeSelect(discord.ui.Select):
             return
         
         # Check balance
-        balance = await self.view.cog.game_engine.get_balance(interaction.user.id)
+        balance = await self.view.cog.game_engine.get_balance(interaction.user.id, user=interaction.user)
         if balance is None:
             await interaction.response.send_message(
                 embed=build_error_embed("Error", "Failed to check balance"),
@@ -154,7 +154,8 @@ class UpgradeSelect(discord.ui.Select):
         bank_success, new_balance = await self.view.cog.game_engine.apply_bank_transaction(
             interaction.user.id,
             -upgrade.cost,
-            f"Purchased upgrade: {upgrade.name}"
+            f"Purchased upgrade: {upgrade.name}",
+            user=interaction.user,
         )
         
         if not bank_success:
@@ -165,7 +166,7 @@ class UpgradeSelect(discord.ui.Select):
             return
         
         # Add upgrade to profile
-        self.view.profile.owned_upgrades.append(upgrade_id)
+        self.view.profile.add_upgrade(upgrade_id)
         await self.view.cog.repository.save_profile(self.view.profile)
         
         # Show success and refresh